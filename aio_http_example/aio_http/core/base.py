@@ -1,7 +1,9 @@
 import aiohttp
 import asyncio
-from typing import Any, Dict, List, Optional
+from http.cookies import SimpleCookie
+from typing import Any, Dict, List, Optional, Tuple
 from tenacity import retry, stop_after_attempt, wait_exponential
+from yarl import URL
 from aio_http.core.logger import logger
 
 class AioHttpClientManager:
@@ -58,6 +60,20 @@ class AioHttpClientManager:
                 logger.error("Error sending async request: %s", e)
                 return None
 
+    async def fetch(self, url: str, method: str = "GET", **kwargs) -> Tuple[int, str]:
+        """
+        Sends a single request and returns the status code along with the body.
+
+        Unlike `request`, errors are raised to the caller instead of being logged and
+        turned into None, so callers can tell a failed request from an empty body.
+        """
+        await self._init_session()
+        async with self.semaphore:
+            logger.info("Sending async %s request to %s", method.upper(), url)
+            async with self.session.request(method, url, **kwargs) as response:
+                logger.info("Request to %s returned status code: %d", url, response.status)
+                return response.status, await response.text()
+
     @property
     def request(self):
         """A property to use the retry decorator for single requests."""
@@ -91,6 +107,25 @@ class AioHttpClientManager:
         self.session.headers.update(headers)
         logger.info("Headers set: %s", headers)
 
+    async def set_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """
+        Adds cookies to the aiohttp session.
+
+        Args:
+            cookies (List[Dict[str, Any]]): Cookies in the Selenium dict format (name, value, domain, path, secure).
+        """
+        await self._init_session()
+        for cookie in cookies:
+            domain = (cookie.get("domain") or "").lstrip(".")
+            morsel = SimpleCookie()
+            morsel[cookie["name"]] = cookie["value"]
+            morsel[cookie["name"]]["domain"] = cookie.get("domain") or domain
+            morsel[cookie["name"]]["path"] = cookie.get("path") or "/"
+            if cookie.get("secure"):
+                morsel[cookie["name"]]["secure"] = True
+            self.session.cookie_jar.update_cookies(morsel, response_url=URL(f"https://{domain}/"))
+        logger.info("Cookies set: %d", len(cookies))
+
     async def set_proxies(self, proxies: Dict[str, str]) -> None:
         """Sets proxies for the aiohttp session."""
         await self._init_session()
@@ -1,14 +1,139 @@
-from sqlalchemy import create_engine
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from itertools import islice
+from sqlalchemy import create_engine, event, insert, select
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import TypeVar, Generic, List, Optional
-from aio_http.core.db.config import DATABASE_URL
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, TypeVar, Generic, List, Optional
+from aio_http.core.db.config import DATABASE_URL, ASYNC_DATABASE_URL, ENGINE_OPTIONS, config
 
 ModelType = TypeVar('ModelType', bound='BaseModel')
 
-engine = create_engine(DATABASE_URL)
+def set_sqlite_pragmas(engine, pragmas: Dict[str, str]) -> None:
+    """Apply pragmas to every new connection of a SQLite engine.
+
+    WAL lets readers run alongside the writer, and synchronous=NORMAL only syncs the WAL at
+    checkpoints instead of on every commit, which multiplies write throughput.
+    """
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+engine = create_engine(DATABASE_URL, **ENGINE_OPTIONS)
+if engine.dialect.name == "sqlite":
+    set_sqlite_pragmas(engine, config.sqlite_pragmas)
 Base = declarative_base()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+_async_engine = None
+_async_session_factory = None
+
+def get_async_engine():
+    """Return the AsyncEngine for the configured database, creating it on first use.
+
+    Requires `sqlalchemy[asyncio]` and the asyncio driver of DB_TYPE:
+    aiosqlite, asyncpg or aiomysql.
+    """
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _async_engine = create_async_engine(ASYNC_DATABASE_URL, **ENGINE_OPTIONS)
+        if _async_engine.dialect.name == "sqlite":
+            set_sqlite_pragmas(_async_engine.sync_engine, config.sqlite_pragmas)
+        _async_session_factory = async_sessionmaker(bind=_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_engine
+
+def AsyncSessionLocal():
+    """Create a new AsyncSession bound to the async engine."""
+    get_async_engine()
+    return _async_session_factory()
+
+_session: ContextVar[Optional[Session]] = ContextVar("session", default=None)
+_async_unit_of_work: ContextVar[Optional["_AsyncUnitOfWork"]] = ContextVar("async_unit_of_work", default=None)
+
+def in_transaction() -> bool:
+    """Return True inside a `transaction()` block."""
+    return _session.get() is not None
+
+def in_async_transaction() -> bool:
+    """Return True inside an `async_transaction()` block."""
+    return _async_unit_of_work.get() is not None
+
+@contextmanager
+def transaction() -> Iterator[Session]:
+    """Run the database operations of the block in a single session and transaction.
+
+    Every CRUD method called inside the block uses this session instead of opening its own.
+    The work is committed once when the block exits, or rolled back if it raises, and the
+    session is closed so that its connection goes back to the pool. Nested blocks join the
+    outermost one.
+
+    Yields:
+        Session: The session of the unit of work.
+    """
+    session = _session.get()
+    if session is not None:
+        yield session
+        return
+    session = SessionLocal()
+    token = _session.set(session)
+    try:
+        yield session
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        _session.reset(token)
+        session.close()
+
+class _AsyncUnitOfWork:
+    """The AsyncSession of an `async_transaction()` block, shared by the tasks started inside it."""
+
+    def __init__(self, session: Any) -> None:
+        self.session = session
+        self.lock = asyncio.Lock()
+        self.owner: Optional[asyncio.Task] = None
+
+@asynccontextmanager
+async def async_transaction() -> AsyncIterator[Any]:
+    """Awaitable `transaction()`.
+
+    Tasks started inside the block share its AsyncSession, which does not support concurrent
+    use, so their operations are run one at a time.
+
+    Yields:
+        AsyncSession: The session of the unit of work.
+    """
+    unit_of_work = _async_unit_of_work.get()
+    if unit_of_work is not None:
+        task = asyncio.current_task()
+        if unit_of_work.owner is task:
+            yield unit_of_work.session
+            return
+        async with unit_of_work.lock:
+            unit_of_work.owner = task
+            try:
+                yield unit_of_work.session
+            finally:
+                unit_of_work.owner = None
+        return
+    session = AsyncSessionLocal()
+    token = _async_unit_of_work.set(_AsyncUnitOfWork(session))
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        _async_unit_of_work.reset(token)
+        await session.close()
 
 class BaseModel(Base):
     """Base model class for all database models."""
@@ -16,16 +141,60 @@ class BaseModel(Base):
     __abstract__ = True
 
     def save(self) -> None:
-        """Save the instance to the database."""
-        session: Session = SessionLocal()
-        try:
+        """Save the instance to the database, or flush it into the current `transaction()`."""
+        with transaction() as session:
             session.add(self)
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+            session.flush()
+
+    @classmethod
+    def save_many(cls, instances: Iterable[ModelType], batch_size: int = 1000) -> List[int]:
+        """Save many instances in batches inside a single transaction.
+
+        Args:
+            instances (Iterable[ModelType]): The instances to save.
+            batch_size (int): Number of instances flushed at once.
+
+        Returns:
+            List[int]: The generated ids, in the order of `instances`.
+        """
+        ids: List[int] = []
+        with transaction() as session:
+            iterator = iter(instances)
+            while batch := list(islice(iterator, batch_size)):
+                session.add_all(batch)
+                session.flush()
+                ids.extend(instance.id for instance in batch)
+        return ids
+
+    @classmethod
+    def bulk_insert(cls, rows: Iterable[Dict[str, Any]], batch_size: int = 1000) -> List[int]:
+        """Insert rows with executemany-style statements inside a single transaction.
+
+        Skips the ORM unit of work entirely, so no instances are created.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): Column values keyed by column name.
+            batch_size (int): Number of rows per INSERT statement.
+
+        Returns:
+            List[int]: The generated ids, in the order of `rows`, when the database supports
+                RETURNING with executemany (SQLite, PostgreSQL); an empty list otherwise.
+        """
+        ids: List[int] = []
+        returning = engine.dialect.insert_executemany_returning
+        statement = insert(cls.__table__)
+        # sort_by_parameter_order makes SQLite send one INSERT per row, as its autoincrement key
+        # is no sentinel; its rowids follow the order of the VALUES, so they are sorted instead
+        sort_ids = engine.dialect.name == "sqlite"
+        if returning:
+            statement = statement.returning(cls.__table__.c.id, sort_by_parameter_order=not sort_ids)
+        with transaction() as session:
+            iterator = iter(rows)
+            while batch := list(islice(iterator, batch_size)):
+                result = session.execute(statement, batch)
+                if returning:
+                    ids.extend(sorted(result.scalars()) if sort_ids else result.scalars())
+        return ids
 
     @classmethod
     def get(cls: TypeVar('T', bound='BaseModel'), id: int) -> Optional[ModelType]:
@@ -37,11 +206,8 @@ class BaseModel(Base):
         Returns:
             Optional[ModelType]: The instance if found, otherwise None.
         """
-        session: Session = SessionLocal()
-        try:
-            return session.query(cls).filter(cls.id == id).one_or_none()
-        finally:
-            session.close()
+        with transaction() as session:
+            return session.get(cls, id)
 
     @classmethod
     def get_all(cls: TypeVar('T', bound='BaseModel')) -> List[ModelType]:
@@ -50,40 +216,122 @@ class BaseModel(Base):
         Returns:
             List[ModelType]: A list of all instances.
         """
-        session: Session = SessionLocal()
-        try:
+        with transaction() as session:
             return session.query(cls).all()
-        finally:
-            session.close()
+
+    @classmethod
+    def iter_where(cls, *criteria, chunk_size: int = 1000, **filters) -> Iterator[ModelType]:
+        """Stream the instances matching the criteria and/or filters in id order, in bounded memory.
+
+        Rows are read in chunks with keyset pagination on `id`, each chunk in its own short
+        transaction, so no session or cursor is held open while the caller processes them.
+
+        Args:
+            *criteria: SQLAlchemy expressions, e.g. `Joke.category == "Pun"`.
+            chunk_size (int): Number of rows read per query.
+            **filters: Column values the instances must be equal to.
+
+        Yields:
+            ModelType: The matching instances, detached from their session.
+        """
+        last_id = 0
+        while True:
+            statement = select(cls).where(cls.id > last_id, *criteria).filter_by(**filters).order_by(cls.id).limit(chunk_size)
+            with transaction() as session:
+                instances = session.scalars(statement).all()
+            yield from instances
+            if len(instances) < chunk_size:
+                return
+            last_id = instances[-1].id
+
+    @classmethod
+    def iter_all(cls, chunk_size: int = 1000) -> Iterator[ModelType]:
+        """Stream all instances of the model in id order, in bounded memory."""
+        return cls.iter_where(chunk_size=chunk_size)
+
+    async def async_save(self) -> None:
+        """Save the instance to the database without blocking the event loop."""
+        async with async_transaction() as session:
+            session.add(self)
+            await session.flush()
+
+    @classmethod
+    async def async_save_many(cls, instances: Iterable[ModelType], batch_size: int = 1000) -> List[int]:
+        """Awaitable `save_many`."""
+        ids: List[int] = []
+        async with async_transaction() as session:
+            iterator = iter(instances)
+            while batch := list(islice(iterator, batch_size)):
+                session.add_all(batch)
+                await session.flush()
+                ids.extend(instance.id for instance in batch)
+        return ids
+
+    @classmethod
+    async def async_get(cls, id: int) -> Optional[ModelType]:
+        """Awaitable `get`."""
+        async with async_transaction() as session:
+            return await session.get(cls, id)
+
+    @classmethod
+    async def async_query(cls, *criteria, **filters) -> List[ModelType]:
+        """Retrieve the instances matching SQLAlchemy criteria and/or column equality filters.
+
+        Args:
+            *criteria: SQLAlchemy expressions, e.g. `Joke.category.in_(["Pun", "Dark"])`.
+            **filters: Column values the instances must be equal to.
+
+        Returns:
+            List[ModelType]: The matching instances.
+        """
+        async with async_transaction() as session:
+            return list((await session.scalars(select(cls).where(*criteria).filter_by(**filters))).all())
+
+    @classmethod
+    async def async_get_all(cls) -> List[ModelType]:
+        """Awaitable `get_all`."""
+        return await cls.async_query()
+
+    @classmethod
+    async def async_iter_where(cls, *criteria, chunk_size: int = 1000, **filters) -> AsyncIterator[ModelType]:
+        """Awaitable `iter_where`, to be used with `async for`."""
+        last_id = 0
+        while True:
+            statement = select(cls).where(cls.id > last_id, *criteria).filter_by(**filters).order_by(cls.id).limit(chunk_size)
+            async with async_transaction() as session:
+                instances = (await session.scalars(statement)).all()
+            for instance in instances:
+                yield instance
+            if len(instances) < chunk_size:
+                return
+            last_id = instances[-1].id
+
+    @classmethod
+    async def async_iter_all(cls, chunk_size: int = 1000) -> AsyncIterator[ModelType]:
+        """Awaitable `iter_all`, to be used with `async for`."""
+        async for instance in cls.async_iter_where(chunk_size=chunk_size):
+            yield instance
 
     def update(self, **kwargs) -> None:
         """Update the model instance with the given keyword arguments.
 
+        The instance is usually detached from the session it was loaded with, so its state
+        is merged into the current session before flushing.
+
         Args:
             **kwargs: The fields to update with their new values.
         """
-        session: Session = SessionLocal()
-        try:
+        with transaction() as session:
             for key, value in kwargs.items():
                 setattr(self, key, value)
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+            session.merge(self)
+            session.flush()
 
     def delete(self) -> None:
         """Delete the model instance from the database."""
-        session: Session = SessionLocal()
-        try:
-            session.delete(self)
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        with transaction() as session:
+            session.delete(session.merge(self))
+            session.flush()
 
 def get_db() -> Session:
     """Dependency that provides a database session.
@@ -103,3 +351,8 @@ def init_db(model=None) -> None:
         model.__table__.create(bind=engine)
     else:
         Base.metadata.create_all(bind=engine)
+
+async def async_init_db() -> None:
+    """Initialize the database by creating all tables through the async engine."""
+    async with get_async_engine().begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
@@ -1,14 +1,108 @@
-from typing import Type, Dict, ClassVar, List, Optional, Any
-from sqlalchemy import Column, Integer, String, Boolean, JSON, Float, Interval, Date
+import threading
+from typing import Type, Dict, ClassVar, Iterable, List, Mapping, Optional, Any
+from sqlalchemy import Column, ForeignKey, event, select, Integer, String, Boolean, JSON, Float, Interval, Date, DateTime, Time
 from datetime import datetime, date, time
-from sqlalchemy.orm import Session
-from pydantic import BaseModel as PydanticBaseModel
-from aio_http.core.db import SessionLocal, Base, init_db
+from sqlalchemy.orm import Session, relationship
+from pydantic import BaseModel as PydanticBaseModel, TypeAdapter
+from aio_http.core.db import Base, engine, in_transaction, transaction
 import inspect
 
 from typing import TypeVar
 
 created_models: Dict[str, Type[Base]] = {}
+materialized_models: Dict[type, Type[Base]] = {}
+row_adapters: Dict[type, TypeAdapter] = {}
+_schema_lock = threading.Lock()
+
+
+def _schema_subclasses(schema: type) -> List[type]:
+    """Return every subclass of a schema, recursively."""
+    subclasses = []
+    for subclass in schema.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_schema_subclasses(subclass))
+    return subclasses
+
+
+def _nested_fields(schema: type) -> Dict[str, type]:
+    """Return the fields of a schema holding another BaseSchema, mapped to the nested schema."""
+    return {
+        name: field_type for name, field_type in schema.__annotations__.items()
+        if inspect.isclass(field_type) and issubclass(field_type, BaseSchema)
+    }
+
+
+def _nested_schemas(schema: type) -> List[type]:
+    """Return the BaseSchema subclasses a schema has fields of."""
+    return list(_nested_fields(schema).values())
+
+
+def _with_dependencies(schemas: Iterable[type]) -> List[type]:
+    """Return the schemas preceded by the nested schemas they reference, recursively."""
+    ordered: Dict[type, None] = {}
+    for schema in schemas:
+        ordered.update(dict.fromkeys(_with_dependencies(_nested_schemas(schema))))
+        ordered[schema] = None
+    return list(ordered)
+
+
+def _to_model(record: "BaseSchema") -> Base:
+    """Build the mapped instance of a record, with mapped instances for its nested records."""
+    values = {}
+    for name, value in record:
+        if isinstance(value, BaseSchema):
+            value = _to_model(value)
+        elif isinstance(value, PydanticBaseModel):
+            value = value.model_dump()
+        values[name] = value
+    return get_model(type(record))(**values)
+
+
+def _forget_on_rollback(session: Session, pending: Dict[type, Type[Base]]) -> None:
+    """Unregister the schemas whose tables were created in the session's transaction if it rolls back."""
+    def forget(session: Session) -> None:
+        for schema in pending:
+            materialized_models.pop(schema, None)
+
+    event.listen(session, "after_rollback", forget, once=True)
+
+
+def ensure_schema(*schemas: Type["BaseSchema"]) -> List[Type[Base]]:
+    """Build the SQLAlchemy models of the given schemas, or of every BaseSchema subclass, and create their tables once per process.
+
+    The schemas of nested fields are materialized as well, so that foreign keys have a table to point to.
+    """
+    schemas = schemas or tuple(_schema_subclasses(BaseSchema))
+    with _schema_lock:
+        pending = {
+            schema: create_sqlalchemy_model_from_pydantic(schema)
+            for schema in _with_dependencies(schemas)
+            if schema not in materialized_models
+        }
+        if pending:
+            tables = [model_class.__table__ for model_class in pending.values()]
+            if in_transaction() and engine.dialect.name == "sqlite":
+                # SQLite has a single writer and transactional DDL: create the tables in the
+                # caller's transaction, and unregister them if it rolls back
+                with transaction() as session:
+                    Base.metadata.create_all(bind=session.connection(), tables=tables)
+                    _forget_on_rollback(session, pending)
+            else:
+                # Own connection, so that the caller's rollback cannot undo a registered table
+                # and MySQL's implicit commit on DDL cannot commit the caller's pending writes
+                with engine.begin() as connection:
+                    Base.metadata.create_all(bind=connection, tables=tables)
+            materialized_models.update(pending)
+            print(f"Tables for {', '.join(schema.__name__ for schema in pending)} created or already exist.")
+    return [materialized_models[schema] for schema in schemas]
+
+
+def get_model(schema: Type["BaseSchema"]) -> Type[Base]:
+    """Return the mapped model class of a schema, materializing it on first use."""
+    model_class = materialized_models.get(schema)
+    if model_class is None:
+        model_class = ensure_schema(schema)[0]
+    return model_class
 
 class BaseSchema(PydanticBaseModel):
     """Base Pydantic model with CRUD methods."""
@@ -25,99 +119,119 @@ class BaseSchema(PydanticBaseModel):
             frozenset: list,
             bytes: lambda v: v.decode(),
         }
-    
-    def __init__(self, **data: Any):
-        super().__init__(**data)
-        self.init_db()
-    
-    
+
     @classmethod
     def init_db(cls) -> None:
-        """Create the corresponding table in the database."""
-        model_class = create_sqlalchemy_model_from_pydantic(cls)
-        Base.metadata.create_all(bind=SessionLocal().bind)
-        print(f"Table for {cls.__name__} created or already exists.")
+        """Create the corresponding table in the database, if this process has not done so yet."""
+        ensure_schema(cls)
 
     def save(self) -> None:
-        """Save the current instance to the database."""
-        session = SessionLocal()
+        """Save the current instance, and its nested records, to the database, or flush them into the current `transaction()`."""
         try:
-            model_class = create_sqlalchemy_model_from_pydantic(self.__class__)
-            model_instance = model_class(**self.dict())
-            session.add(model_instance)
-            session.commit()
-            print(f"Saved to {model_instance.__tablename__}")
-            return model_instance.id
+            with transaction() as session:
+                model_instance = _to_model(self)
+                session.add(model_instance)
+                session.flush()
+                print(f"Saved to {model_instance.__tablename__}")
+                return model_instance.id
         except Exception as e:
-            session.rollback()
+            if in_transaction():
+                raise
             print("Error saving instance:", e)
-        finally:
-            session.close()
+
+    @classmethod
+    def _select_rows(cls, model_class: Type[Base]) -> Any:
+        """Select the id and field columns as plain rows, bypassing the ORM identity map."""
+        table = model_class.__table__
+        return select(
+            table.c.id,
+            *(table.c[name] for name in cls.model_fields if name in table.c),
+            *(table.c[f"{name}_id"] for name in _nested_fields(cls)),
+        )
+
+    @classmethod
+    def _fetch_rows(cls, session: Session, statement: Any) -> List[Mapping[str, Any]]:
+        """Execute a `_select_rows` statement and return its rows, with nested records in place of their foreign keys.
+
+        The nested records of all rows are loaded together, with one IN query per nested field and chunk.
+        """
+        rows = session.execute(statement).mappings().all()
+        nested = _nested_fields(cls)
+        if not nested or not rows:
+            return rows
+        rows = [dict(row) for row in rows]
+        for name, schema in nested.items():
+            key = f"{name}_id"
+            model_class = get_model(schema)
+            child_ids = list({row[key] for row in rows if row[key] is not None})
+            children = {}
+            for start in range(0, len(child_ids), 500):
+                chunk = child_ids[start:start + 500]
+                child_rows = schema._fetch_rows(session, schema._select_rows(model_class).where(model_class.id.in_(chunk)))
+                children.update(zip((row["id"] for row in child_rows), schema.from_rows(child_rows)))
+            for row in rows:
+                row[name] = children.get(row.pop(key))
+        return rows
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> List["BaseSchema"]:
+        """Build instances from row mappings keyed by field name, validated in bulk through one cached list TypeAdapter."""
+        adapter = row_adapters.get(cls)
+        if adapter is None:
+            adapter = row_adapters[cls] = TypeAdapter(List[cls])
+        return adapter.validate_python([dict(row) for row in rows])
 
     @classmethod
     def get_by_id(cls, id: int) -> Optional["BaseSchema"]:
         """Retrieve an instance by its ID."""
-        session = SessionLocal()
-        try:
-            model_class = create_sqlalchemy_model_from_pydantic(cls)
-            instance = session.query(model_class).filter(model_class.id == id).first()
-            if instance:
-                return cls.from_orm(instance) 
-            return None
-        finally:
-            session.close()
+        model_class = get_model(cls)
+        with transaction() as session:
+            rows = cls._fetch_rows(session, cls._select_rows(model_class).where(model_class.id == id))
+            return next(iter(cls.from_rows(rows)), None)
 
     @classmethod
     def update(cls, id: int, **kwargs: Any) -> Optional["BaseSchema"]:
         """Update an instance by its ID."""
-        session = SessionLocal()
         try:
-            model_class = create_sqlalchemy_model_from_pydantic(cls)
-            instance = session.query(model_class).filter(model_class.id == id).first()
-            if instance:
-                for key, value in kwargs.items():
-                    setattr(instance, key, value)
-                session.commit()
-                return cls.from_orm(instance)
-            return None
+            with transaction() as session:
+                instance = session.get(get_model(cls), id)
+                if instance:
+                    for key, value in kwargs.items():
+                        setattr(instance, key, _to_model(value) if isinstance(value, BaseSchema) else value)
+                    session.flush()
+                    return cls.get_by_id(id)
+                return None
         except Exception as e:
-            session.rollback()
+            if in_transaction():
+                raise
             print("Error updating instance:", e)
             return None
-        finally:
-            session.close()
 
     @classmethod
     def delete(cls, id: int) -> bool:
         """Delete an instance by its ID."""
-        session = SessionLocal()
         try:
-            model_class = create_sqlalchemy_model_from_pydantic(cls)
-            instance = session.query(model_class).filter(model_class.id == id).first()
-            if instance:
-                session.delete(instance)
-                session.commit()
-                print(f"{cls.__name__} with ID {id} deleted.")
-                return True
-            print(f"{cls.__name__} with ID {id} not found.")
-            return False
+            with transaction() as session:
+                instance = session.get(get_model(cls), id)
+                if instance:
+                    session.delete(instance)
+                    session.flush()
+                    print(f"{cls.__name__} with ID {id} deleted.")
+                    return True
+                print(f"{cls.__name__} with ID {id} not found.")
+                return False
         except Exception as e:
-            session.rollback()
+            if in_transaction():
+                raise
             print("Error deleting instance:", e)
             return False
-        finally:
-            session.close()
 
     @classmethod
     def get_all(cls) -> List["BaseSchema"]:
         """Retrieve all instances of the model."""
-        session = SessionLocal()
-        try:
-            model_class = create_sqlalchemy_model_from_pydantic(cls)
-            instances = session.query(model_class).all()
-            return [cls.from_orm(instance) for instance in instances]
-        finally:
-            session.close()
+        model_class = get_model(cls)
+        with transaction() as session:
+            return cls.from_rows(cls._fetch_rows(session, cls._select_rows(model_class)))
 
 T = TypeVar('T', bound=PydanticBaseModel)
 
@@ -138,14 +252,13 @@ def create_sqlalchemy_model_from_pydantic(pydantic_model: Type[T]) -> Type[Base]
         if field_name == 'id':
             continue
         
-        if inspect.isclass(field_type) and issubclass(field_type, PydanticBaseModel):
-            # Handle relationship to another model
-            print("Found Relationnship")
+        if inspect.isclass(field_type) and issubclass(field_type, BaseSchema):
+            # Nested records are stored in their own table and referenced by a foreign key;
+            # the relationship lets `_to_model` save them along with their parent
             related_model_class = create_sqlalchemy_model_from_pydantic(field_type)
-            related_model_class.save()
-            # Create a foreign key column for the related model
-            attributes[field_name + "_id"] = Column(Integer, ForeignKey(f"{related_model_class.__tablename__}.id"))
-            attributes[field_name] = relationship(related_model_class.__name__, back_populates=f"{field_name}_backref")
+            attributes[field_name + "_id"] = Column(Integer, ForeignKey(f"{related_model_class.__tablename__}.id"), nullable=False)
+            attributes[field_name] = relationship(related_model_class)
+            continue
         elif field_type == bool:
             column_type = Boolean
         elif field_type == str:
@@ -0,0 +1,60 @@
+"""
+Compare SQLite write throughput with SQLite's default pragmas and with the pragmas pydb applies.
+
+Usage:
+    python benchmark_db.py [rows]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert
+
+from pydb import set_sqlite_pragmas
+from pydb.config import config
+
+metadata = MetaData()
+rows_table = Table(
+    "benchmark_rows",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String),
+)
+
+SQLITE_DEFAULTS = {"journal_mode": "DELETE", "synchronous": "FULL"}
+
+
+def run(label: str, pragmas: dict, rows: int) -> None:
+    """Time one transaction per row, then a single bulk insert, on a fresh database file."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'benchmark.db'}")
+        set_sqlite_pragmas(engine, pragmas)
+        metadata.create_all(engine)
+
+        start = time.perf_counter()
+        for i in range(rows):
+            with engine.begin() as connection:
+                connection.execute(insert(rows_table), {"name": f"row-{i}"})
+        commits_per_second = rows / (time.perf_counter() - start)
+
+        bulk_rows = [{"name": f"bulk-{i}"} for i in range(rows * 10)]
+        start = time.perf_counter()
+        with engine.begin() as connection:
+            connection.execute(insert(rows_table), bulk_rows)
+        bulk_rows_per_second = len(bulk_rows) / (time.perf_counter() - start)
+
+        engine.dispose()
+
+    print(f"{label:<8} {commits_per_second:>10,.0f} commits/s {bulk_rows_per_second:>12,.0f} rows/s in bulk")
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{rows} single-row transactions, then {rows * 10} rows in one transaction")
+    run("default", SQLITE_DEFAULTS, rows)
+    run("pydb", config.sqlite_pragmas, rows)
+
+
+if __name__ == "__main__":
+    main()
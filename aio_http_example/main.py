@@ -3,13 +3,13 @@ import asyncio
 from pydantic import ValidationError
 from aio_http.core.base import AioHttpClientManager
 from aio_http.core.logger import logger
-from aio_http.core.db import init_db, SessionLocal
+from pydb.core import ensure_schema
 from icecream import ic
 
 from schema import Joke, Flags
 
-# Initialize the database
-init_db()
+# Create the tables once, ahead of the first save
+ensure_schema(Flags, Joke)
 
 async def fetch_jokes(client_manager: AioHttpClientManager, urls: list[str]) -> list[dict]:
     """
@@ -48,13 +48,9 @@ def save_jokes(jokes: list[dict]) -> None:
     Returns:
         None
     """
-    try:        
-        for joke in jokes:
-            flags_data = joke.get("flags", {})
-            flags = Flags(**flags_data)
-            flags_id = flags.save()
-            
-            joke_model = Joke(
+    try:
+        joke_models = [
+            Joke(
                 error=joke.get("error", False),
                 category=joke.get("category", ""),
                 joke_type=joke.get("type"),
@@ -63,13 +59,15 @@ def save_jokes(jokes: list[dict]) -> None:
                 delivery=joke.get("delivery"),
                 safe=joke.get("safe", True),
                 lang=joke.get("lang", ""),
-                flags=flags_id
+                flags=Flags(**joke.get("flags", {}))
             )
+            for joke in jokes
+        ]
+        # The flags are inserted first and linked to their jokes, in the same transaction
+        joke_ids = Joke.save_many(joke_models)
+
+        logger.info("Saved %d jokes", len(joke_ids))
 
-            joke_model.save()
-            
-            logger.info(f"Joke saved successfully")
- 
     except Exception as e:
         logger.error("An error occurred while saving jokes: %s", e)
 
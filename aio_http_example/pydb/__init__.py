@@ -1,16 +1,140 @@
-from sqlalchemy import create_engine
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import TypeVar, Generic, List, Optional
-from pydb.config import DATABASE_URL
+from typing import Any, AsyncIterator, Dict, Iterator, TypeVar, Generic, List, Optional
+from pydb.config import DATABASE_URL, ASYNC_DATABASE_URL, ENGINE_OPTIONS, config
 from pydb.logger import logger
 
 ModelType = TypeVar('ModelType', bound='BaseModel')
 
-engine = create_engine(DATABASE_URL)
+def set_sqlite_pragmas(engine, pragmas: Dict[str, str]) -> None:
+    """Apply pragmas to every new connection of a SQLite engine.
+
+    WAL lets readers run alongside the writer, and synchronous=NORMAL only syncs the WAL at
+    checkpoints instead of on every commit, which multiplies write throughput.
+    """
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+engine = create_engine(DATABASE_URL, **ENGINE_OPTIONS)
+if engine.dialect.name == "sqlite":
+    set_sqlite_pragmas(engine, config.sqlite_pragmas)
 Base = declarative_base()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+_async_engine = None
+_async_session_factory = None
+
+def get_async_engine():
+    """Return the AsyncEngine for the configured database, creating it on first use.
+
+    Requires `sqlalchemy[asyncio]` and the asyncio driver of DB_TYPE:
+    aiosqlite, asyncpg or aiomysql.
+    """
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _async_engine = create_async_engine(ASYNC_DATABASE_URL, **ENGINE_OPTIONS)
+        if _async_engine.dialect.name == "sqlite":
+            set_sqlite_pragmas(_async_engine.sync_engine, config.sqlite_pragmas)
+        _async_session_factory = async_sessionmaker(bind=_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_engine
+
+def AsyncSessionLocal():
+    """Create a new AsyncSession bound to the async engine."""
+    get_async_engine()
+    return _async_session_factory()
+
+_session: ContextVar[Optional[Session]] = ContextVar("session", default=None)
+_async_unit_of_work: ContextVar[Optional["_AsyncUnitOfWork"]] = ContextVar("async_unit_of_work", default=None)
+
+def in_transaction() -> bool:
+    """Return True inside a `transaction()` block."""
+    return _session.get() is not None
+
+def in_async_transaction() -> bool:
+    """Return True inside an `async_transaction()` block."""
+    return _async_unit_of_work.get() is not None
+
+@contextmanager
+def transaction() -> Iterator[Session]:
+    """Run the database operations of the block in a single session and transaction.
+
+    Every CRUD method called inside the block uses this session instead of opening its own.
+    The work is committed once when the block exits, or rolled back if it raises, and the
+    session is closed so that its connection goes back to the pool. Nested blocks join the
+    outermost one.
+
+    Yields:
+        Session: The session of the unit of work.
+    """
+    session = _session.get()
+    if session is not None:
+        yield session
+        return
+    session = SessionLocal()
+    token = _session.set(session)
+    try:
+        yield session
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        _session.reset(token)
+        session.close()
+
+class _AsyncUnitOfWork:
+    """The AsyncSession of an `async_transaction()` block, shared by the tasks started inside it."""
+
+    def __init__(self, session: Any) -> None:
+        self.session = session
+        self.lock = asyncio.Lock()
+        self.owner: Optional[asyncio.Task] = None
+
+@asynccontextmanager
+async def async_transaction() -> AsyncIterator[Any]:
+    """Awaitable `transaction()`.
+
+    Tasks started inside the block share its AsyncSession, which does not support concurrent
+    use, so their operations are run one at a time.
+
+    Yields:
+        AsyncSession: The session of the unit of work.
+    """
+    unit_of_work = _async_unit_of_work.get()
+    if unit_of_work is not None:
+        task = asyncio.current_task()
+        if unit_of_work.owner is task:
+            yield unit_of_work.session
+            return
+        async with unit_of_work.lock:
+            unit_of_work.owner = task
+            try:
+                yield unit_of_work.session
+            finally:
+                unit_of_work.owner = None
+        return
+    session = AsyncSessionLocal()
+    token = _async_unit_of_work.set(_AsyncUnitOfWork(session))
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        _async_unit_of_work.reset(token)
+        await session.close()
+
 def get_db() -> Session:
     """Dependency that provides a database session.
 
@@ -3,6 +3,14 @@ from dotenv import load_dotenv, find_dotenv
 
 load_dotenv(find_dotenv(".env"))
 
+# Connection pool settings per deployment profile, selected with DB_PROFILE
+ENGINE_PROFILES = {
+    "default": {"pool_size": 5, "max_overflow": 10, "pool_pre_ping": True, "pool_recycle": 3600},
+    "crawler": {"pool_size": 20, "max_overflow": 30, "pool_pre_ping": True, "pool_recycle": 1800, "pool_timeout": 10},
+    "edge": {"pool_size": 2, "max_overflow": 2, "pool_pre_ping": False, "pool_recycle": -1},
+}
+
+
 class Config:
     DB_TYPE = os.getenv('DB_TYPE', 'sqlite')
     DB_NAME = os.getenv('DB_NAME', 'example.db')
@@ -10,6 +18,20 @@ class Config:
     DB_PASSWORD = os.getenv('DB_PASSWORD', '')
     DB_HOST = os.getenv('DB_HOST', 'localhost')
     DB_PORT = os.getenv('DB_PORT', '5432')
+
+    DB_PROFILE = os.getenv('DB_PROFILE', 'default')
+    DB_POOL_SIZE = os.getenv('DB_POOL_SIZE')
+    DB_MAX_OVERFLOW = os.getenv('DB_MAX_OVERFLOW')
+    DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING')
+    DB_POOL_RECYCLE = os.getenv('DB_POOL_RECYCLE')
+    DB_POOL_TIMEOUT = os.getenv('DB_POOL_TIMEOUT')
+
+    # SQLite pragmas set on every new connection, an empty value leaves the SQLite default
+    SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT = os.getenv('SQLITE_BUSY_TIMEOUT', '5000')
+    SQLITE_CACHE_SIZE = os.getenv('SQLITE_CACHE_SIZE', '-64000')
+    SQLITE_MMAP_SIZE = os.getenv('SQLITE_MMAP_SIZE', '268435456')
     
     AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
     AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
@@ -30,6 +52,56 @@ class Config:
         else:
             raise ValueError("Unsupported database type")
 
+    @property
+    def engine_options(self):
+        """Construct the create_engine keyword arguments from DB_PROFILE and the DB_POOL_* overrides."""
+        if self.DB_PROFILE not in ENGINE_PROFILES:
+            raise ValueError("Unsupported engine profile")
+        options = dict(ENGINE_PROFILES[self.DB_PROFILE])
+        overrides = {
+            "pool_size": (self.DB_POOL_SIZE, int),
+            "max_overflow": (self.DB_MAX_OVERFLOW, int),
+            "pool_pre_ping": (self.DB_POOL_PRE_PING, lambda value: value.lower() in ("1", "true", "yes")),
+            "pool_recycle": (self.DB_POOL_RECYCLE, int),
+            "pool_timeout": (self.DB_POOL_TIMEOUT, int),
+        }
+        for key, (value, cast) in overrides.items():
+            if value:
+                options[key] = cast(value)
+        if self.DB_TYPE == 'sqlite' and self.DB_NAME in ('', ':memory:'):
+            # In-memory databases live in a single connection, there is no pool to size
+            options = {key: value for key, value in options.items() if key == "pool_pre_ping"}
+        return options
+
+    @property
+    def sqlite_pragmas(self):
+        """Return the pragmas applied to new SQLite connections."""
+        pragmas = {
+            "journal_mode": self.SQLITE_JOURNAL_MODE,
+            "synchronous": self.SQLITE_SYNCHRONOUS,
+            "busy_timeout": self.SQLITE_BUSY_TIMEOUT,
+            "cache_size": self.SQLITE_CACHE_SIZE,
+            "mmap_size": self.SQLITE_MMAP_SIZE,
+        }
+        return {name: value for name, value in pragmas.items() if value}
+
+    @property
+    def async_database_url(self):
+        """Construct the database URL for the asyncio driver of the selected database type."""
+        if self.DB_TYPE == 'postgres':
+            return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        
+        elif self.DB_TYPE == 'mysql':
+            return f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        
+        elif self.DB_TYPE == 'sqlite':
+            return f"sqlite+aiosqlite:///{self.DB_NAME}"
+        
+        else:
+            raise ValueError("Unsupported database type")
+
 
 config = Config()
 DATABASE_URL = config.database_url
+ASYNC_DATABASE_URL = config.async_database_url
+ENGINE_OPTIONS = config.engine_options
@@ -1,12 +1,16 @@
 import typing
-from typing import Type, Dict, ClassVar, List, Optional, Any, TypeVar, get_origin, get_args, Union
-from sqlalchemy import Column, Integer, String, Boolean, JSON, Float, Interval, Date
+import threading
+from itertools import islice
+from typing import Type, Dict, ClassVar, AsyncIterator, Iterable, Iterator, List, Mapping, Optional, Any, Tuple, TypeVar, get_origin, get_args, Union
+from sqlalchemy import Column, ForeignKey, Integer, String, Boolean, JSON, Float, Interval, Date, DateTime, Time, Index, Table, event, func, insert, select, tuple_, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from datetime import datetime, date, time
 from sqlalchemy.orm import Session
-from pydantic import BaseModel as PydanticBaseModel, ValidationError
-from pydb import SessionLocal, Base, init_db
+from pydantic import BaseModel as PydanticBaseModel, TypeAdapter, ValidationError
+from pydb import SessionLocal, Base, engine, get_async_engine, async_transaction, in_async_transaction, in_transaction, transaction
 import inspect
 from pydb.s3_handler import S3Client
+from pydb.writer import BufferedWriter
 from pydb.logger import logger
 from pydb.config import Config
 import json
@@ -16,11 +20,335 @@ from dotenv import load_dotenv, find_dotenv
 from typing import TypeVar
 
 created_models: Dict[str, Type[Base]] = {}
+materialized_models: Dict[type, Type[Base]] = {}
+row_adapters: Dict[type, TypeAdapter] = {}
+nested_schemas: Dict[type, Dict[str, type]] = {}
+_schema_lock = threading.Lock()
 T = TypeVar('T', bound='BaseSchema')
 
+
+def _schema_subclasses(schema: type) -> List[type]:
+    """Return every subclass of a schema, recursively."""
+    subclasses = []
+    for subclass in schema.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_schema_subclasses(subclass))
+    return subclasses
+
+
+def _nested_schema(annotation: Any) -> Optional[type]:
+    """Return the BaseSchema subclass a field annotation refers to, unwrapping Optional."""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+    if inspect.isclass(annotation) and issubclass(annotation, BaseSchema):
+        return annotation
+    return None
+
+
+def nested_fields(schema: Type["BaseSchema"]) -> Dict[str, type]:
+    """Return the fields of a schema holding another BaseSchema, mapped to the nested schema.
+
+    Each of them is stored as a `<field>_id` foreign key to the table of the nested schema.
+    """
+    fields = nested_schemas.get(schema)
+    if fields is None:
+        fields = nested_schemas[schema] = {
+            name: nested for name, field_info in schema.model_fields.items() if (nested := _nested_schema(field_info.annotation))
+        }
+    return fields
+
+
+def _with_dependencies(schemas: Iterable[type]) -> List[type]:
+    """Return the schemas preceded by the nested schemas they reference, recursively."""
+    ordered: Dict[type, None] = {}
+    for schema in schemas:
+        ordered.update(dict.fromkeys(_with_dependencies(nested_fields(schema).values())))
+        ordered[schema] = None
+    return list(ordered)
+
+
+def _pending_models(schemas: tuple) -> Dict[type, Type[Base]]:
+    """Build the models of the schemas, and of the schemas they nest, that have no table in this process yet."""
+    with _schema_lock:
+        return {
+            schema: create_sqlalchemy_model_from_pydantic(schema)
+            for schema in _with_dependencies(schemas)
+            if schema not in materialized_models
+        }
+
+
+def _create_tables(connection: Any, pending: Dict[type, Type[Base]]) -> None:
+    """Create the missing tables, and the indexes declared since an existing table was created."""
+    tables = [model_class.__table__ for model_class in pending.values()]
+    Base.metadata.create_all(bind=connection, tables=tables)
+    for table in tables:
+        for index in table.indexes:
+            index.create(bind=connection, checkfirst=True)
+
+
+def _forget_on_rollback(session: Session, pending: Dict[type, Type[Base]]) -> None:
+    """Unregister the schemas whose tables were created in the session's transaction if it rolls back."""
+    def forget(session: Session) -> None:
+        for schema in pending:
+            materialized_models.pop(schema, None)
+
+    event.listen(session, "after_rollback", forget, once=True)
+
+
+def _mark_materialized(pending: Dict[type, Type[Base]]) -> None:
+    materialized_models.update(pending)
+    logger.info(f"Get or Create Tables: {', '.join(model_class.__tablename__ for model_class in pending.values())}")
+
+
+def ensure_schema(*schemas: Type["BaseSchema"]) -> List[Type[Base]]:
+    """Build the SQLAlchemy models of the given schemas and create their tables, once per process.
+
+    Without arguments, every BaseSchema subclass defined so far is materialized, which lets
+    applications create all tables ahead of time at startup. Schemas are otherwise
+    materialized lazily by their first database operation.
+
+    The DDL runs on its own connection and is committed right away, outside any `transaction()`
+    block: a rollback of the caller's work cannot undo a table the registry already knows, and
+    MySQL's implicit commit on DDL cannot commit the caller's pending writes. SQLite allows a
+    single writer, so inside a block its DDL runs in the block's transaction instead, where it
+    is transactional, and the schemas are unregistered again if the block rolls back.
+
+    Returns:
+        List[Type[Base]]: The mapped model classes, in the order of `schemas`.
+    """
+    schemas = schemas or tuple(_schema_subclasses(BaseSchema))
+    pending = _pending_models(schemas)
+    if pending:
+        if in_transaction() and engine.dialect.name == "sqlite":
+            with transaction() as session:
+                _create_tables(session.connection(), pending)
+                _forget_on_rollback(session, pending)
+        else:
+            with engine.begin() as connection:
+                _create_tables(connection, pending)
+        _mark_materialized(pending)
+    return [materialized_models[schema] for schema in schemas]
+
+
+async def async_ensure_schema(*schemas: Type["BaseSchema"]) -> List[Type[Base]]:
+    """Awaitable `ensure_schema`, creating the tables through the async engine."""
+    schemas = schemas or tuple(_schema_subclasses(BaseSchema))
+    pending = _pending_models(schemas)
+    if pending:
+        async_engine = get_async_engine()
+        if in_async_transaction() and async_engine.dialect.name == "sqlite":
+            async with async_transaction() as session:
+                await session.run_sync(lambda sync_session: _create_tables(sync_session.connection(), pending))
+                _forget_on_rollback(session.sync_session, pending)
+        else:
+            async with async_engine.begin() as connection:
+                await connection.run_sync(_create_tables, pending)
+        _mark_materialized(pending)
+    return [materialized_models[schema] for schema in schemas]
+
+
+def get_model(schema: Type["BaseSchema"]) -> Type[Base]:
+    """Return the mapped model class of a schema, materializing it on first use."""
+    model_class = materialized_models.get(schema)
+    if model_class is None:
+        model_class = ensure_schema(schema)[0]
+    return model_class
+
+
+async def async_get_model(schema: Type["BaseSchema"]) -> Type[Base]:
+    """Awaitable `get_model`, creating the table through the async engine."""
+    model_class = materialized_models.get(schema)
+    if model_class is None:
+        model_class = (await async_ensure_schema(schema))[0]
+    return model_class
+
+
+def batched(iterable: Iterable[Any], size: int) -> Iterable[List[Any]]:
+    """Yield successive lists of at most `size` items from an iterable."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def insert_returning_ids(table: Table, dialect_name: str) -> Any:
+    """Build an INSERT returning the generated ids, sent as batched multi-row statements.
+
+    `sort_by_parameter_order` needs a sentinel column to keep the batches, which an
+    autoincrement key is not on SQLite, so SQLAlchemy would send one INSERT per row there.
+    SQLite assigns rowids in the order of the VALUES under its single writer lock instead,
+    so `returned_ids` sorts them back.
+    """
+    if dialect_name == "sqlite":
+        return insert(table).returning(table.c.id)
+    return insert(table).returning(table.c.id, sort_by_parameter_order=True)
+
+
+def returned_ids(result: Any, dialect_name: str) -> List[int]:
+    """Return the ids of an `insert_returning_ids` result in the order of its rows."""
+    ids = list(result.scalars())
+    return sorted(ids) if dialect_name == "sqlite" else ids
+
+
+def insert_rows(session: Session, model_class: Type[Base], rows: List[Dict[str, Any]]) -> List[int]:
+    """Insert rows with executemany-style multi-row statements and return their generated ids.
+
+    Dialects that support RETURNING with executemany (SQLite, PostgreSQL) return the ids
+    straight from the INSERT; on the others the rows are added through the ORM so their
+    ids are still known after the flush.
+    """
+    if not rows:
+        return []
+    dialect_name = session.bind.dialect.name
+    if session.bind.dialect.insert_executemany_returning:
+        result = session.execute(insert_returning_ids(model_class.__table__, dialect_name), rows)
+        return returned_ids(result, dialect_name)
+    instances = [model_class(**row) for row in rows]
+    session.add_all(instances)
+    session.flush()
+    return [instance.id for instance in instances]
+
+
+def upsert_statement(
+    dialect_name: str,
+    table: Table,
+    conflict_columns: Optional[List[str]],
+    update_columns: List[str],
+    returning: bool,
+) -> Any:
+    """Build a dialect-native INSERT that updates or skips the rows conflicting on a unique key.
+
+    SQLite and PostgreSQL use ON CONFLICT DO UPDATE/DO NOTHING; MySQL and MariaDB use
+    ON DUPLICATE KEY UPDATE, or INSERT IGNORE when there is nothing to update.
+    """
+    if dialect_name in ("sqlite", "postgresql"):
+        statement = (sqlite if dialect_name == "sqlite" else postgresql).insert(table)
+        if update_columns:
+            statement = statement.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={column: statement.excluded[column] for column in update_columns},
+            )
+            if returning:
+                # Every row is either inserted or updated, so `upserted_ids` maps the ids back to the
+                # input rows through their conflict key; sort_by_parameter_order would make SQLite
+                # send one statement per row
+                return statement.returning(table.c.id, *(table.c[column] for column in conflict_columns))
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=conflict_columns)
+        return statement.returning(table.c.id) if returning else statement
+    if dialect_name in ("mysql", "mariadb"):
+        statement = mysql.insert(table)
+        if update_columns:
+            return statement.on_duplicate_key_update({column: statement.inserted[column] for column in update_columns})
+        return statement.prefix_with("IGNORE")
+    raise NotImplementedError(f"Upserts are not supported on {dialect_name}")
+
+
+def _stored_child_ids(stored_nested: List[Dict[str, Optional[int]]], positions: List[Optional[int]], count: int, key: str) -> List[Optional[int]]:
+    """Return, for each distinct nested record, the stored id of the first record referencing it that has one."""
+    ids: List[Optional[int]] = [None] * count
+    for stored, position in zip(stored_nested, positions):
+        if position is not None and ids[position] is None:
+            ids[position] = stored.get(key)
+    return ids
+
+
+def reference_counts_statement(table: Table, key: str, child_ids: Iterable[int]) -> Any:
+    """Count the rows of `table` referencing each of the nested ids through the foreign key `key`."""
+    column = table.c[key]
+    return select(column, func.count()).where(column.in_(set(child_ids))).group_by(column)
+
+
+def _exclusive_child_ids(
+    child_ids: List[Optional[int]],
+    stored_ids: List[Optional[int]],
+    stored_nested: List[Dict[str, Optional[int]]],
+    key: str,
+    reference_counts: Mapping[int, int],
+) -> List[Optional[int]]:
+    """Keep the stored nested ids that may be updated in place, replacing the others by None.
+
+    A nested row is only reused when no parent outside the given records references it, since
+    `save_many` lets records sharing a nested instance share its row, and by a single nested
+    record, so that two records of the batch are not written to the same row.
+    """
+    owners: Dict[int, int] = {}
+    for parent_id, child_id in {parent_id: stored.get(key) for parent_id, stored in zip(stored_ids, stored_nested) if parent_id is not None}.items():
+        if child_id is not None:
+            owners[child_id] = owners.get(child_id, 0) + 1
+    used = set()
+    exclusive: List[Optional[int]] = []
+    for child_id in child_ids:
+        if child_id is None or child_id in used or reference_counts.get(child_id, 0) > owners.get(child_id, 0):
+            exclusive.append(None)
+        else:
+            used.add(child_id)
+            exclusive.append(child_id)
+    return exclusive
+
+
+def _unique_children(records: List["BaseSchema"], name: str) -> Tuple[List["BaseSchema"], List[Optional[int]]]:
+    """Collect the distinct nested records of a field, and for each record the position of its nested record, or None."""
+    children: List["BaseSchema"] = []
+    positions: List[Optional[int]] = []
+    seen: Dict[int, int] = {}
+    for record in records:
+        child = getattr(record, name)
+        if child is None:
+            positions.append(None)
+            continue
+        position = seen.get(id(child))
+        if position is None:
+            position = seen[id(child)] = len(children)
+            children.append(child)
+        positions.append(position)
+    return children, positions
+
+
+def dedupe_rows(rows: List[Dict[str, Any]], conflict_columns: List[str]) -> List[Dict[str, Any]]:
+    """Keep the last of the rows sharing a conflict key, as PostgreSQL rejects updating a row twice in one statement.
+
+    Rows with a NULL in their key never conflict and are all kept.
+    """
+    unique: Dict[Any, Dict[str, Any]] = {}
+    for index, row in enumerate(rows):
+        key = tuple(row[column] for column in conflict_columns)
+        unique[index if None in key else key] = row
+    return list(unique.values())
+
+
+def upserted_ids(result: Any, rows: List[Dict[str, Any]], conflict_columns: List[str]) -> List[int]:
+    """Return the ids of an upsert returning `id` and the conflict columns, in the order of `rows`."""
+    ids = {tuple(returned[1:]): returned[0] for returned in result}
+    return [ids.get(tuple(row[column] for column in conflict_columns)) for row in rows]
+
+
+def key_lookup(table: Table, conflict_columns: List[str], keys: Iterable[tuple]) -> Any:
+    """Select the id and conflict columns of the stored rows whose key is one of `keys`."""
+    columns = [table.c[column] for column in conflict_columns]
+    if len(columns) == 1:
+        return select(table.c.id, *columns).where(columns[0].in_([key[0] for key in keys]))
+    return select(table.c.id, *columns).where(tuple_(*columns).in_(list(keys)))
+
+
+async def async_insert_rows(session: Any, model_class: Type[Base], rows: List[Dict[str, Any]]) -> List[int]:
+    """Awaitable `insert_rows` for an AsyncSession."""
+    if not rows:
+        return []
+    dialect_name = session.bind.dialect.name
+    if session.bind.dialect.insert_executemany_returning:
+        result = await session.execute(insert_returning_ids(model_class.__table__, dialect_name), rows)
+        return returned_ids(result, dialect_name)
+    instances = [model_class(**row) for row in rows]
+    session.add_all(instances)
+    await session.flush()
+    return [instance.id for instance in instances]
+
 class BaseSchema(PydanticBaseModel):
     """Base Pydantic model with CRUD methods."""
     id: ClassVar[int] = None
+    # Composite indexes, as tuples of field names, e.g. [("domain", "scraped_at")]
+    __indexes__: ClassVar[List[tuple]] = []
     
     class Config:
         from_attributes = True
@@ -34,10 +362,6 @@ class BaseSchema(PydanticBaseModel):
             bytes: lambda v: v.decode(),
         }
     
-    def __init__(self, **data: Any):
-        super().__init__(**data)
-        self.init_db()
-    
     @classmethod
     @property
     def s3_client(cls):
@@ -63,99 +387,663 @@ class BaseSchema(PydanticBaseModel):
     
     @classmethod
     def init_db(cls) -> None:
-        """Create the corresponding table in the database."""
-        model_class = create_sqlalchemy_model_from_pydantic(cls)
-        Base.metadata.create_all(bind=SessionLocal().bind)
-        logger.info(f"Get or Create Table: {model_class.__tablename__}")
+        """Create the corresponding table in the database, if this process has not done so yet."""
+        ensure_schema(cls)
 
-    def save(self) -> None:
-        """Save the current instance to the database."""
-        session = SessionLocal()
+    def save(self) -> Optional[int]:
+        """Save the current instance, and the nested records it holds, to the database.
+
+        Inside a `transaction()` block the rows are only flushed, and committed with the block.
+
+        Returns:
+            Optional[int]: The generated id, or None if saving failed.
+        """
+        ids = type(self).save_many([self])
+        return ids[0] if ids else None
+                        
+    @classmethod
+    def save_many(cls, records: Iterable["BaseSchema"], batch_size: int = 1000) -> List[int]:
+        """Save many instances in batches inside a single transaction.
+
+        Nested records are saved first, with one INSERT per nested field and batch, and the
+        generated ids are stored in the `<field>_id` foreign keys of the batch. A nested
+        instance shared by several records of a batch is saved once.
+
+        Args:
+            records (Iterable[BaseSchema]): The instances to save.
+            batch_size (int): Number of rows per INSERT statement.
+
+        Returns:
+            List[int]: The generated ids, in the order of `records`.
+        """
+        if not nested_fields(cls):
+            return cls.bulk_insert((record.model_dump() for record in records), batch_size)
         try:
-            model_class = create_sqlalchemy_model_from_pydantic(self.__class__)
-            model_data = self.model_dump()
-            model_instance = model_class(**model_data)
-            session.add(model_instance)
-            session.commit()
-            logger.info(f"Saved to {model_instance.__tablename__}")
-            return model_instance.id
+            # Create the tables, nested ones included, before the nested rows take the write lock
+            get_model(cls)
+            with transaction():
+                ids: List[int] = []
+                for batch in batched(records, batch_size):
+                    ids.extend(cls.bulk_insert(cls._resolve_rows(batch, batch_size), batch_size))
+                return ids
         except Exception as e:
-            session.rollback()
-            logger.error(f"Error saving {self.__class__.__name__}: {str(e)}")
-        finally:
-            session.close()   
-                        
+            if in_transaction():
+                raise
+            logger.error(f"Error saving {cls.__name__} rows: {str(e)}")
+            return []
+
+    @classmethod
+    def _resolve_rows(
+        cls,
+        records: List["BaseSchema"],
+        batch_size: int,
+        stored_ids: Optional[List[Optional[int]]] = None,
+        update_columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Dump records to rows, saving their nested records first and replacing them with foreign keys.
+
+        Records with a stored id keep their stored nested rows: those are updated in place when
+        their foreign key is among `update_columns` (every column by default) and no other
+        parent references them, and left as they are otherwise, instead of being orphaned by
+        new rows. A nested row shared with other parents is replaced by a new row instead.
+
+        Must be called inside a `transaction()` block, so that a failure rolls back the nested rows too.
+        """
+        nested = nested_fields(cls)
+        if not nested:
+            return [record.model_dump() for record in records]
+        rows = [record.model_dump(exclude=set(nested)) for record in records]
+        stored_nested = cls._stored_nested_ids(stored_ids) if stored_ids else [{}] * len(records)
+        for name, schema in nested.items():
+            key = f"{name}_id"
+            children, positions = _unique_children(records, name)
+            ids = _stored_child_ids(stored_nested, positions, len(children), key)
+            if children:
+                update_stored = update_columns is None or key in update_columns
+                if update_stored and any(id is not None for id in ids):
+                    with transaction() as session:
+                        statement = reference_counts_statement(get_model(cls).__table__, key, (id for id in ids if id is not None))
+                        counts = dict(session.execute(statement).all())
+                    ids = _exclusive_child_ids(ids, stored_ids, stored_nested, key, counts)
+                ids = schema._save_in_place(children, ids, batch_size, update_stored)
+            for row, position in zip(rows, positions):
+                row[key] = None if position is None else ids[position]
+        return rows
+
+    @classmethod
+    def _stored_nested_ids(cls, stored_ids: List[Optional[int]]) -> List[Dict[str, Optional[int]]]:
+        """Return the stored foreign keys of the nested fields of each row id, or an empty dict."""
+        model_class = get_model(cls)
+        table = model_class.__table__
+        statement = select(table.c.id, *(table.c[f"{name}_id"] for name in nested_fields(cls)))
+        with transaction() as session:
+            stored = {row["id"]: row for row in session.execute(statement.where(table.c.id.in_(set(stored_ids) - {None}))).mappings()}
+        return [stored.get(id, {}) for id in stored_ids]
+
+    @classmethod
+    def _save_in_place(cls, records: List["BaseSchema"], ids: List[Optional[int]], batch_size: int, update_stored: bool = True) -> List[int]:
+        """Save the records without an id and, if `update_stored`, update the stored rows of the others by id."""
+        ids = list(ids)
+        stored = [index for index, id in enumerate(ids) if id is not None]
+        new = [index for index, id in enumerate(ids) if id is None]
+        if stored and update_stored:
+            rows = cls._resolve_rows([records[index] for index in stored], batch_size, [ids[index] for index in stored])
+            with transaction() as session:
+                session.execute(update(get_model(cls)), [{**row, "id": ids[index]} for index, row in zip(stored, rows)])
+        if new:
+            for index, id in zip(new, cls.save_many([records[index] for index in new], batch_size)):
+                ids[index] = id
+        return ids
+
+    @classmethod
+    def bulk_insert(cls, rows: Iterable[Dict[str, Any]], batch_size: int = 1000) -> List[int]:
+        """Insert already validated rows in batches inside a single transaction.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): Column values keyed by field name.
+            batch_size (int): Number of rows per INSERT statement.
+
+        Returns:
+            List[int]: The generated ids, in the order of `rows`.
+        """
+        try:
+            with transaction() as session:
+                model_class = get_model(cls)
+                ids: List[int] = []
+                for batch in batched(rows, batch_size):
+                    ids.extend(insert_rows(session, model_class, batch))
+                logger.info(f"Saved {len(ids)} rows to {model_class.__tablename__}")
+                return ids
+        except Exception as e:
+            if in_transaction():
+                raise
+            logger.error(f"Error saving {cls.__name__} rows: {str(e)}")
+            return []
+
+    @classmethod
+    def _upsert_columns(
+        cls,
+        model_class: Type[Base],
+        conflict_columns: Optional[Iterable[str]],
+        update_columns: Optional[Iterable[str]],
+    ) -> tuple:
+        """Resolve the conflict target and the updated columns of an upsert."""
+        table = model_class.__table__
+        unique_columns = [column.name for column in table.columns if column.unique]
+        conflict_columns = list(conflict_columns) if conflict_columns is not None else unique_columns
+        if not conflict_columns:
+            raise ValueError(f"{cls.__name__} has no Field(unique=True) to upsert on")
+        if update_columns is None:
+            update_columns = [column.name for column in table.columns if column.name != "id" and column.name not in conflict_columns]
+        return conflict_columns, list(update_columns)
+
+    @classmethod
+    def upsert_many(
+        cls,
+        records: Iterable["BaseSchema"],
+        update_columns: Optional[Iterable[str]] = None,
+        conflict_columns: Optional[Iterable[str]] = None,
+        batch_size: int = 1000,
+    ) -> List[int]:
+        """Insert many instances, updating the existing rows they conflict with, in batches.
+
+        Conflicts are detected on the `Field(unique=True)` columns. On SQLite and PostgreSQL the
+        conflict target must be a single unique constraint, so pass `conflict_columns` when the
+        model has several unique fields. Records repeating a key within a batch are written
+        once, the last one winning. The nested records of a conflicting row update the nested
+        rows it references, when their foreign key is among `update_columns`, rather than
+        being saved as new rows.
+
+        Args:
+            records (Iterable[BaseSchema]): The instances to insert or refresh.
+            update_columns (Optional[Iterable[str]]): Columns overwritten on conflict. Defaults to
+                every other column; an empty list skips conflicting rows instead.
+            conflict_columns (Optional[Iterable[str]]): Unique columns identifying a row.
+            batch_size (int): Number of rows per statement.
+
+        Returns:
+            List[int]: The ids of the inserted or updated rows where the database supports
+                RETURNING with executemany (SQLite, PostgreSQL), in the order of `records` when
+                conflicting rows are updated; an empty list otherwise.
+        """
+        try:
+            with transaction() as session:
+                model_class = get_model(cls)
+                conflict_columns, update_columns = cls._upsert_columns(model_class, conflict_columns, update_columns)
+                returning = session.bind.dialect.insert_executemany_returning
+                statement = upsert_statement(session.bind.dialect.name, model_class.__table__, conflict_columns, update_columns, returning)
+                ids: List[int] = []
+                count = 0
+                for batch in batched(records, batch_size):
+                    stored_ids = None
+                    if nested_fields(cls):
+                        keys = [tuple(getattr(record, column) for column in conflict_columns) for record in batch]
+                        found = {tuple(row[1:]): row[0] for row in session.execute(key_lookup(model_class.__table__, conflict_columns, set(keys)))}
+                        stored_ids = [found.get(key) for key in keys]
+                    rows = cls._resolve_rows(batch, batch_size, stored_ids, update_columns)
+                    result = session.execute(statement, dedupe_rows(rows, conflict_columns))
+                    if returning:
+                        ids.extend(upserted_ids(result, rows, conflict_columns) if update_columns else result.scalars())
+                    count += len(batch)
+                logger.info(f"Upserted {count} rows into {model_class.__tablename__}")
+                return ids
+        except Exception as e:
+            if in_transaction():
+                raise
+            logger.error(f"Error upserting {cls.__name__} rows: {str(e)}")
+            return []
+
     @classmethod
     def query(cls):
-        """Return a query object for the model."""
-        session = SessionLocal()
-        model_class = create_sqlalchemy_model_from_pydantic(cls)
-        return session.query(model_class)    
+        """Return a query object for the model, bound to the session of the current `transaction()`.
+
+        Raises:
+            RuntimeError: If called outside a `transaction()` block, whose session
+                would otherwise never be closed.
+        """
+        if not in_transaction():
+            raise RuntimeError(f"{cls.__name__}.query() must be called inside a `with transaction():` block")
+        with transaction() as session:
+            return session.query(get_model(cls))
     
     @classmethod
-    def get_by_id(cls, id: int) -> Optional["BaseSchema"]:
+    def _select_rows(cls, model_class: Type[Base]) -> Any:
+        """Select the id and field columns as plain rows, bypassing the ORM identity map."""
+        table = model_class.__table__
+        return select(
+            table.c.id,
+            *(table.c[name] for name in cls.model_fields if name in table.c),
+            *(table.c[f"{name}_id"] for name in nested_fields(cls)),
+        )
+
+    @classmethod
+    def _fetch_rows(cls, session: Session, statement: Any, trusted: bool) -> List[Mapping[str, Any]]:
+        """Execute a `_select_rows` statement and return its rows, with nested records in place of their foreign keys.
+
+        The nested records of all rows are loaded together, with one IN query per nested field and chunk.
+        """
+        rows = session.execute(statement).mappings().all()
+        nested = nested_fields(cls)
+        if not nested or not rows:
+            return rows
+        rows = [dict(row) for row in rows]
+        for name, schema in nested.items():
+            key = f"{name}_id"
+            model_class = get_model(schema)
+            children = {}
+            for chunk in batched({row[key] for row in rows if row[key] is not None}, 500):
+                child_rows = schema._fetch_rows(session, schema._select_rows(model_class).where(model_class.id.in_(chunk)), trusted)
+                children.update(zip((row["id"] for row in child_rows), schema.from_rows(child_rows, trusted)))
+            for row in rows:
+                row[name] = children.get(row.pop(key))
+        return rows
+
+    @classmethod
+    async def _async_fetch_rows(cls, session: Any, statement: Any, trusted: bool) -> List[Mapping[str, Any]]:
+        """Awaitable `_fetch_rows` for an AsyncSession."""
+        rows = (await session.execute(statement)).mappings().all()
+        nested = nested_fields(cls)
+        if not nested or not rows:
+            return rows
+        rows = [dict(row) for row in rows]
+        for name, schema in nested.items():
+            key = f"{name}_id"
+            model_class = await async_get_model(schema)
+            children = {}
+            for chunk in batched({row[key] for row in rows if row[key] is not None}, 500):
+                child_rows = await schema._async_fetch_rows(session, schema._select_rows(model_class).where(model_class.id.in_(chunk)), trusted)
+                children.update(zip((row["id"] for row in child_rows), schema.from_rows(child_rows, trusted)))
+            for row in rows:
+                row[name] = children.get(row.pop(key))
+        return rows
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]], trusted: bool = False) -> List["BaseSchema"]:
+        """Build instances from row mappings keyed by field name, e.g. `session.execute(...).mappings()`.
+
+        Rows are validated in bulk through one cached list TypeAdapter, which is several times
+        faster than a `from_orm` per ORM instance.
+
+        Args:
+            rows (Iterable[Mapping[str, Any]]): The rows to convert. Extra keys such as `id` are ignored.
+            trusted (bool): Skip validation, like `model_construct`. Only use it for rows written
+                by this application through validated models.
+
+        Returns:
+            List[BaseSchema]: One instance per row.
+        """
+        if not trusted:
+            adapter = row_adapters.get(cls)
+            if adapter is None:
+                adapter = row_adapters[cls] = TypeAdapter(List[cls])
+            return adapter.validate_python([dict(row) for row in rows])
+        if cls.__private_attributes__:
+            return [cls.model_construct(**{name: row[name] for name in cls.model_fields if name in row}) for row in rows]
+        # Same result as model_construct, minus its per-field default and alias handling:
+        # the rows carry a value for every field, keyed by field name
+        names = list(cls.model_fields)
+        fields_set = set(names)
+        records = []
+        for row in rows:
+            record = cls.__new__(cls)
+            object.__setattr__(record, "__dict__", {name: row[name] for name in names})
+            object.__setattr__(record, "__pydantic_fields_set__", fields_set.copy())
+            object.__setattr__(record, "__pydantic_extra__", None)
+            object.__setattr__(record, "__pydantic_private__", None)
+            records.append(record)
+        return records
+
+    @classmethod
+    def get_by_id(cls, id: int, trusted: bool = False) -> Optional["BaseSchema"]:
         """Retrieve an instance by its ID."""
-        session = SessionLocal()
-        try:
-            model_class = create_sqlalchemy_model_from_pydantic(cls)
-            instance = session.query(model_class).filter(model_class.id == id).first()
-            if instance:
-                return cls.from_orm(instance) 
-            return None
-        finally:
-            session.close()
+        model_class = get_model(cls)
+        with transaction() as session:
+            rows = cls._fetch_rows(session, cls._select_rows(model_class).where(model_class.id == id), trusted)
+            return next(iter(cls.from_rows(rows, trusted)), None)
     
+    @classmethod
+    def get_by(cls, trusted: bool = False, **filters: Any) -> Optional["BaseSchema"]:
+        """Retrieve the first instance whose columns equal the given values, e.g. `Page.get_by(url=url)`.
+
+        Declare the looked-up fields with `Field(index=True)` or `Field(unique=True)` so that
+        the lookup uses an index instead of scanning the table.
+        """
+        model_class = get_model(cls)
+        with transaction() as session:
+            rows = cls._fetch_rows(session, cls._select_rows(model_class).filter_by(**filters).limit(1), trusted)
+            return next(iter(cls.from_rows(rows, trusted)), None)
+
+    @classmethod
+    def get_many_by(cls, field: str, values: Iterable[Any], chunk_size: int = 500, trusted: bool = False) -> List["BaseSchema"]:
+        """Retrieve the instances whose `field` is one of `values`, with one IN query per chunk.
+
+        Useful for deduplication: look up a whole batch of scraped keys at once and only save
+        the ones that are missing.
+
+        Args:
+            field (str): The field to match, ideally declared with `Field(index=True)`.
+            values (Iterable[Any]): The values to look up. Duplicates are queried once.
+            chunk_size (int): Number of values per IN clause, keeping statements under the
+                database's bound parameter limit.
+            trusted (bool): Build the instances without validation, see `from_rows`.
+
+        Returns:
+            List[BaseSchema]: The matching instances, in no particular order.
+        """
+        model_class = get_model(cls)
+        column = getattr(model_class, field)
+        records = []
+        with transaction() as session:
+            for chunk in batched(dict.fromkeys(values), chunk_size):
+                rows = cls._fetch_rows(session, cls._select_rows(model_class).where(column.in_(chunk)), trusted)
+                records.extend(cls.from_rows(rows, trusted))
+        return records
+
     @classmethod
     def update(cls, id: int, **kwargs: Any) -> Optional["BaseSchema"]:
-        """Update an instance by its ID."""
-        session = SessionLocal()
+        """Update an instance by its ID. A nested record passed for a nested field is saved as a new row."""
         try:
-            model_class = create_sqlalchemy_model_from_pydantic(cls)
-            instance = session.query(model_class).filter(model_class.id == id).first()
-            if instance:
-                for key, value in kwargs.items():
-                    setattr(instance, key, value)
-                session.commit()
-                return cls.from_orm(instance)
-            return None
+            with transaction() as session:
+                instance = session.get(get_model(cls), id)
+                if instance:
+                    nested = nested_fields(cls)
+                    for key, value in kwargs.items():
+                        if key in nested:
+                            key, value = f"{key}_id", value.save() if value is not None else None
+                        setattr(instance, key, value)
+                    session.flush()
+                    return cls.get_by_id(id)
+                return None
         except Exception as e:
-            session.rollback()
-            print("Error updating instance:", e)
+            if in_transaction():
+                raise
+            logger.error(f"Error updating {cls.__name__} with ID {id}: {str(e)}")
             return None
-        finally:
-            session.close()
 
     @classmethod
     def delete(cls, id: int) -> bool:
         """Delete an instance by its ID."""
-        session = SessionLocal()
         try:
-            model_class = create_sqlalchemy_model_from_pydantic(cls)
-            instance = session.query(model_class).filter(model_class.id == id).first()
-            if instance:
-                session.delete(instance)
-                session.commit()
-                print(f"{cls.__name__} with ID {id} deleted.")
-                return True
-            print(f"{cls.__name__} with ID {id} not found.")
-            return False
+            with transaction() as session:
+                instance = session.get(get_model(cls), id)
+                if instance:
+                    session.delete(instance)
+                    session.flush()
+                    logger.info(f"{cls.__name__} with ID {id} deleted.")
+                    return True
+                logger.info(f"{cls.__name__} with ID {id} not found.")
+                return False
         except Exception as e:
-            session.rollback()
-            print("Error deleting instance:", e)
+            if in_transaction():
+                raise
+            logger.error(f"Error deleting {cls.__name__} with ID {id}: {str(e)}")
             return False
-        finally:
-            session.close()
 
     @classmethod
-    def get_all(cls) -> List["BaseSchema"]:
-        """Retrieve all instances of the model."""
-        session = SessionLocal()
+    def get_all(cls, trusted: bool = False) -> List["BaseSchema"]:
+        """Retrieve all instances of the model. Prefer `iter_all` for large tables."""
+        model_class = get_model(cls)
+        with transaction() as session:
+            return cls.from_rows(cls._fetch_rows(session, cls._select_rows(model_class), trusted), trusted)
+
+    @classmethod
+    def iter_where(cls, *criteria: Any, chunk_size: int = 1000, trusted: bool = False, **filters: Any) -> Iterator["BaseSchema"]:
+        """Stream the instances matching the criteria and/or filters in id order, in bounded memory.
+
+        Rows are read in chunks with keyset pagination on `id`, each chunk in its own short
+        transaction, so no session or cursor is held open while the caller processes them.
+
+        Args:
+            *criteria: SQLAlchemy expressions built on `get_model(cls)`.
+            chunk_size (int): Number of rows read per query.
+            trusted (bool): Build the instances without validation, see `from_rows`.
+            **filters: Column values the instances must be equal to.
+
+        Yields:
+            BaseSchema: The matching instances.
+        """
+        model_class = get_model(cls)
+        last_id = 0
+        while True:
+            statement = (
+                cls._select_rows(model_class)
+                .where(model_class.id > last_id, *criteria)
+                .filter_by(**filters)
+                .order_by(model_class.id)
+                .limit(chunk_size)
+            )
+            with transaction() as session:
+                rows = cls._fetch_rows(session, statement, trusted)
+            chunk = cls.from_rows(rows, trusted)
+            last_id = rows[-1]["id"] if rows else last_id
+            yield from chunk
+            if len(chunk) < chunk_size:
+                return
+
+    @classmethod
+    def iter_all(cls, chunk_size: int = 1000, trusted: bool = False) -> Iterator["BaseSchema"]:
+        """Stream all instances of the model in id order, in bounded memory."""
+        return cls.iter_where(chunk_size=chunk_size, trusted=trusted)
+
+    async def async_save(self) -> Optional[int]:
+        """Awaitable `save`: save the current instance without blocking the event loop.
+
+        Returns:
+            Optional[int]: The generated id, or None if saving failed.
+        """
+        ids = await self.async_save_many([self])
+        return ids[0] if ids else None
+
+    @classmethod
+    async def async_save_many(cls, records: Iterable["BaseSchema"], batch_size: int = 1000) -> List[int]:
+        """Awaitable `save_many`."""
+        if not nested_fields(cls):
+            return await cls.async_bulk_insert((record.model_dump() for record in records), batch_size)
         try:
-            model_class = create_sqlalchemy_model_from_pydantic(cls)
-            instances = session.query(model_class).all()
-            return [cls.from_orm(instance) for instance in instances]
-        finally:
-            session.close()
+            await async_get_model(cls)
+            async with async_transaction():
+                ids: List[int] = []
+                for batch in batched(records, batch_size):
+                    ids.extend(await cls.async_bulk_insert(await cls._async_resolve_rows(batch, batch_size), batch_size))
+                return ids
+        except Exception as e:
+            if in_async_transaction():
+                raise
+            logger.error(f"Error saving {cls.__name__} rows: {str(e)}")
+            return []
+
+    @classmethod
+    async def _async_resolve_rows(
+        cls,
+        records: List["BaseSchema"],
+        batch_size: int,
+        stored_ids: Optional[List[Optional[int]]] = None,
+        update_columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Awaitable `_resolve_rows`, to be called inside an `async_transaction()` block."""
+        nested = nested_fields(cls)
+        if not nested:
+            return [record.model_dump() for record in records]
+        rows = [record.model_dump(exclude=set(nested)) for record in records]
+        stored_nested = await cls._async_stored_nested_ids(stored_ids) if stored_ids else [{}] * len(records)
+        for name, schema in nested.items():
+            key = f"{name}_id"
+            children, positions = _unique_children(records, name)
+            ids = _stored_child_ids(stored_nested, positions, len(children), key)
+            if children:
+                update_stored = update_columns is None or key in update_columns
+                if update_stored and any(id is not None for id in ids):
+                    statement = reference_counts_statement((await async_get_model(cls)).__table__, key, (id for id in ids if id is not None))
+                    async with async_transaction() as session:
+                        counts = dict((await session.execute(statement)).all())
+                    ids = _exclusive_child_ids(ids, stored_ids, stored_nested, key, counts)
+                ids = await schema._async_save_in_place(children, ids, batch_size, update_stored)
+            for row, position in zip(rows, positions):
+                row[key] = None if position is None else ids[position]
+        return rows
+
+    @classmethod
+    async def _async_stored_nested_ids(cls, stored_ids: List[Optional[int]]) -> List[Dict[str, Optional[int]]]:
+        """Awaitable `_stored_nested_ids`."""
+        model_class = await async_get_model(cls)
+        table = model_class.__table__
+        statement = select(table.c.id, *(table.c[f"{name}_id"] for name in nested_fields(cls)))
+        async with async_transaction() as session:
+            result = await session.execute(statement.where(table.c.id.in_(set(stored_ids) - {None})))
+            stored = {row["id"]: row for row in result.mappings()}
+        return [stored.get(id, {}) for id in stored_ids]
+
+    @classmethod
+    async def _async_save_in_place(cls, records: List["BaseSchema"], ids: List[Optional[int]], batch_size: int, update_stored: bool = True) -> List[int]:
+        """Awaitable `_save_in_place`."""
+        ids = list(ids)
+        stored = [index for index, id in enumerate(ids) if id is not None]
+        new = [index for index, id in enumerate(ids) if id is None]
+        if stored and update_stored:
+            rows = await cls._async_resolve_rows([records[index] for index in stored], batch_size, [ids[index] for index in stored])
+            model_class = await async_get_model(cls)
+            async with async_transaction() as session:
+                await session.execute(update(model_class), [{**row, "id": ids[index]} for index, row in zip(stored, rows)])
+        if new:
+            for index, id in zip(new, await cls.async_save_many([records[index] for index in new], batch_size)):
+                ids[index] = id
+        return ids
+
+    @classmethod
+    async def async_bulk_insert(cls, rows: Iterable[Dict[str, Any]], batch_size: int = 1000) -> List[int]:
+        """Awaitable `bulk_insert`."""
+        try:
+            model_class = await async_get_model(cls)
+            async with async_transaction() as session:
+                ids: List[int] = []
+                for batch in batched(rows, batch_size):
+                    ids.extend(await async_insert_rows(session, model_class, batch))
+                logger.info(f"Saved {len(ids)} rows to {model_class.__tablename__}")
+                return ids
+        except Exception as e:
+            if in_async_transaction():
+                raise
+            logger.error(f"Error saving {cls.__name__} rows: {str(e)}")
+            return []
+
+    @classmethod
+    async def async_upsert_many(
+        cls,
+        records: Iterable["BaseSchema"],
+        update_columns: Optional[Iterable[str]] = None,
+        conflict_columns: Optional[Iterable[str]] = None,
+        batch_size: int = 1000,
+    ) -> List[int]:
+        """Awaitable `upsert_many`."""
+        try:
+            model_class = await async_get_model(cls)
+            conflict_columns, update_columns = cls._upsert_columns(model_class, conflict_columns, update_columns)
+            async with async_transaction() as session:
+                returning = session.bind.dialect.insert_executemany_returning
+                statement = upsert_statement(session.bind.dialect.name, model_class.__table__, conflict_columns, update_columns, returning)
+                ids: List[int] = []
+                count = 0
+                for batch in batched(records, batch_size):
+                    stored_ids = None
+                    if nested_fields(cls):
+                        keys = [tuple(getattr(record, column) for column in conflict_columns) for record in batch]
+                        found = {tuple(row[1:]): row[0] for row in await session.execute(key_lookup(model_class.__table__, conflict_columns, set(keys)))}
+                        stored_ids = [found.get(key) for key in keys]
+                    rows = await cls._async_resolve_rows(batch, batch_size, stored_ids, update_columns)
+                    result = await session.execute(statement, dedupe_rows(rows, conflict_columns))
+                    if returning:
+                        ids.extend(upserted_ids(result, rows, conflict_columns) if update_columns else result.scalars())
+                    count += len(batch)
+                logger.info(f"Upserted {count} rows into {model_class.__tablename__}")
+                return ids
+        except Exception as e:
+            if in_async_transaction():
+                raise
+            logger.error(f"Error upserting {cls.__name__} rows: {str(e)}")
+            return []
+
+    @classmethod
+    def writer(cls, **kwargs: Any) -> BufferedWriter:
+        """Return a BufferedWriter that saves instances of the model in bulk from a background task.
+
+        Example:
+            async with Joke.writer(batch_size=500, flush_interval=1.0) as writer:
+                await writer.put(joke)
+        """
+        return BufferedWriter(cls, **kwargs)
+
+    @classmethod
+    async def async_query(cls, *criteria: Any, trusted: bool = False, **filters: Any) -> List["BaseSchema"]:
+        """Retrieve the instances matching SQLAlchemy criteria and/or column equality filters.
+
+        Criteria are built on the mapped model, e.g.
+        `await Joke.async_query(get_model(Joke).category.in_(["Pun", "Dark"]), lang="en")`.
+        """
+        model_class = await async_get_model(cls)
+        statement = cls._select_rows(model_class).where(*criteria).filter_by(**filters)
+        async with async_transaction() as session:
+            rows = await cls._async_fetch_rows(session, statement, trusted)
+            return cls.from_rows(rows, trusted)
+
+    @classmethod
+    async def async_iter_where(cls, *criteria: Any, chunk_size: int = 1000, trusted: bool = False, **filters: Any) -> AsyncIterator["BaseSchema"]:
+        """Awaitable `iter_where`, to be used with `async for`."""
+        model_class = await async_get_model(cls)
+        last_id = 0
+        while True:
+            statement = (
+                cls._select_rows(model_class)
+                .where(model_class.id > last_id, *criteria)
+                .filter_by(**filters)
+                .order_by(model_class.id)
+                .limit(chunk_size)
+            )
+            async with async_transaction() as session:
+                rows = await cls._async_fetch_rows(session, statement, trusted)
+            chunk = cls.from_rows(rows, trusted)
+            last_id = rows[-1]["id"] if rows else last_id
+            for record in chunk:
+                yield record
+            if len(chunk) < chunk_size:
+                return
+
+    @classmethod
+    async def async_iter_all(cls, chunk_size: int = 1000, trusted: bool = False) -> AsyncIterator["BaseSchema"]:
+        """Awaitable `iter_all`, to be used with `async for`."""
+        async for record in cls.async_iter_where(chunk_size=chunk_size, trusted=trusted):
+            yield record
+
+    @classmethod
+    async def async_get_by_id(cls, id: int, trusted: bool = False) -> Optional["BaseSchema"]:
+        """Awaitable `get_by_id`."""
+        model_class = await async_get_model(cls)
+        return next(iter(await cls.async_query(model_class.id == id, trusted=trusted)), None)
+
+    @classmethod
+    async def async_get_by(cls, trusted: bool = False, **filters: Any) -> Optional["BaseSchema"]:
+        """Awaitable `get_by`."""
+        model_class = await async_get_model(cls)
+        async with async_transaction() as session:
+            rows = await cls._async_fetch_rows(session, cls._select_rows(model_class).filter_by(**filters).limit(1), trusted)
+            return next(iter(cls.from_rows(rows, trusted)), None)
+
+    @classmethod
+    async def async_get_many_by(cls, field: str, values: Iterable[Any], chunk_size: int = 500, trusted: bool = False) -> List["BaseSchema"]:
+        """Awaitable `get_many_by`."""
+        model_class = await async_get_model(cls)
+        column = getattr(model_class, field)
+        records = []
+        async with async_transaction() as session:
+            for chunk in batched(dict.fromkeys(values), chunk_size):
+                rows = await cls._async_fetch_rows(session, cls._select_rows(model_class).where(column.in_(chunk)), trusted)
+                records.extend(cls.from_rows(rows, trusted))
+        return records
+
+    @classmethod
+    async def async_get_all(cls, trusted: bool = False) -> List["BaseSchema"]:
+        """Awaitable `get_all`."""
+        return await cls.async_query(trusted=trusted)
+
 
 def create_sqlalchemy_model_from_pydantic(pydantic_model: Type[T]) -> Type[Base]:
     """Creates an SQLAlchemy model class from a Pydantic model."""
@@ -177,15 +1065,15 @@ def create_sqlalchemy_model_from_pydantic(pydantic_model: Type[T]) -> Type[Base]
             continue
         
         nullable = get_origin(field_type) is Union and type(None) in get_args(field_type)
+        if nested_schema := _nested_schema(field_type):
+            # Nested records are stored in their own table and referenced by id
+            related_model_class = create_sqlalchemy_model_from_pydantic(nested_schema)
+            attributes[f"{field_name}_id"] = Column(
+                Integer, ForeignKey(f"{related_model_class.__tablename__}.id"), nullable=nullable, index=True
+            )
+            continue
         if inspect.isclass(field_type) and issubclass(field_type, PydanticBaseModel):
-            # Handle relationship to another model
-            print("Found Relationnship")
-            related_model_class = create_sqlalchemy_model_from_pydantic(field_type)
-            related_model_class.save()
-            # Create a foreign key column for the related model
-            attributes[field_name + "_id"] = Column(Integer, ForeignKey(f"{related_model_class.__tablename__}.id"))
-            attributes[field_name] = relationship(related_model_class.__name__, back_populates=f"{field_name}_backref")
-            
+            column_type = JSON
         elif field_type in [bool, typing.Optional[bool]]:
             column_type = Boolean
         elif field_type in [str, typing.Optional[str]]:
@@ -194,21 +1082,28 @@ def create_sqlalchemy_model_from_pydantic(pydantic_model: Type[T]) -> Type[Base]
             column_type = Integer
         elif field_type in [float, typing.Optional[float]]:
             column_type = Float
-        elif field_type in [bool, typing.Optional[Date]]:
+        elif field_type in [datetime, typing.Optional[datetime]]:
+            column_type = DateTime
+        elif field_type in [date, typing.Optional[date]]:
             column_type = Date
-        elif field_type in [bool, typing.Optional[Time]]:
+        elif field_type in [time, typing.Optional[time]]:
             column_type = Time
-        elif field_type in [bool, typing.Optional[DateTime]]:
-            column_type = DateTime
         else:
             column_type = String
             
         unique = False
+        index = False
         if extra:= field_info.json_schema_extra:
             unique = extra.get("unique")
+            index = extra.get("index")
         
-        attributes[field_name] = Column(column_type, nullable=nullable, unique=unique)
+        attributes[field_name] = Column(column_type, nullable=nullable, unique=unique, index=index)
+
+    if indexes := getattr(pydantic_model, "__indexes__", None):
+        attributes["__table_args__"] = tuple(
+            Index(f"ix_{attributes['__tablename__']}_{'_'.join(columns)}", *columns) for columns in indexes
+        )
 
     model_class = type(model_class_name, (Base,), attributes)
     created_models[model_class_name] = model_class
-    return model_class
\ No newline at end of file
+    return model_class
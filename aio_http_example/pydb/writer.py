@@ -0,0 +1,133 @@
+import asyncio
+import contextvars
+from typing import Any, Iterable, List, Optional
+
+from pydb import async_transaction
+from pydb.logger import logger
+
+_STOP = object()
+
+
+class BufferedWriter:
+    def __init__(
+        self,
+        schema: type,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_buffer: int = 10000,
+        upsert: bool = False,
+        update_columns: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Collects records of a BaseSchema subclass in memory and writes them in bulk from a background task.
+
+        A batch is written as soon as it holds `batch_size` records, or `flush_interval` seconds
+        after its first record arrived, whichever comes first. `put` waits while `max_buffer`
+        records are queued, so producers slow down to the database's pace instead of growing
+        memory without bound.
+
+        Use `async with Joke.writer() as writer:` so that the remaining records are written
+        when the block exits.
+
+        Args:
+            schema (type): The BaseSchema subclass of the records.
+            batch_size (int): Maximum number of records per write.
+            flush_interval (float): Maximum number of seconds a record waits in a partial batch.
+            max_buffer (int): Number of queued records above which `put` waits.
+            upsert (bool): Write with `async_upsert_many` instead of `async_save_many`.
+            update_columns (Optional[Iterable[str]]): Columns updated on conflict when upserting.
+        """
+        self.schema = schema
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.upsert = upsert
+        self.update_columns = list(update_columns) if update_columns is not None else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffer)
+        self.written = 0
+        self.failed = 0
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def start(self) -> None:
+        """Starts the background flush task, if it is not running yet."""
+        if self._task is None:
+            # A clean context, so that the task does not join the async_transaction() of the first caller
+            self._task = contextvars.Context().run(
+                asyncio.get_running_loop().create_task, self._run(), name=f"{self.schema.__name__}-writer"
+            )
+
+    async def put(self, record: Any) -> None:
+        """Queues a record, waiting while the buffer is full."""
+        if self._closed:
+            raise RuntimeError(f"{self.schema.__name__} writer is closed")
+        self.start()
+        await self.queue.put(record)
+
+    async def put_many(self, records: Iterable[Any]) -> None:
+        """Queues several records, waiting while the buffer is full."""
+        for record in records:
+            await self.put(record)
+
+    async def flush(self) -> None:
+        """Waits until every record queued so far has been written."""
+        if self._task is not None:
+            await self.queue.join()
+
+    async def close(self) -> None:
+        """Writes the remaining records and stops the background task."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is not None:
+            await self.queue.put(_STOP)
+            await self._task
+            self._task = None
+        logger.info(f"{self.schema.__name__} writer closed: {self.written} written, {self.failed} failed")
+
+    async def _write(self, batch: List[Any]) -> None:
+        """Writes a batch in one transaction, logging instead of raising so that the writer keeps running."""
+        try:
+            async with async_transaction():
+                if self.upsert:
+                    await self.schema.async_upsert_many(batch, update_columns=self.update_columns, batch_size=self.batch_size)
+                else:
+                    await self.schema.async_save_many(batch, batch_size=self.batch_size)
+            self.written += len(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            logger.error(f"Error writing {len(batch)} {self.schema.__name__} records: {str(e)}")
+
+    async def _run(self) -> None:
+        """Collects batches from the queue and writes them until the writer is closed."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            record = await self.queue.get()
+            if record is _STOP:
+                self.queue.task_done()
+                break
+            batch = [record]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if record is _STOP:
+                    self.queue.task_done()
+                    stopping = True
+                    break
+                batch.append(record)
+            await self._write(batch)
+            for _ in batch:
+                self.queue.task_done()
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
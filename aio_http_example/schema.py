@@ -20,7 +20,7 @@ class Joke(BaseSchema):
     joke: Optional[str] = None
     setup: Optional[str] = None
     delivery: Optional[str] = None
-    flags: int
+    flags: Flags
     safe: bool
     lang: str
 
@@ -10,7 +10,7 @@ def search_and_scroll(driver, search_query):
     search_bar.send_keys(search_query)
     search_bar.submit()
     driver.scroll_to_bottom()
-    driver.wait(10)
+    driver.wait_for_network_idle(timeout=10)
         
 
 def main():
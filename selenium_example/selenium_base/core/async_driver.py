@@ -0,0 +1,122 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List
+
+from selenium_base.core.base import DriverManager
+from selenium_base.core.logger import logger
+from selenium_base.core.pool import DriverPool
+
+
+class AsyncDriverManager:
+    def __init__(self, **driver_kwargs: Any) -> None:
+        """
+        Runs a DriverManager on a dedicated thread and exposes its methods as coroutines.
+
+        Every DriverManager method is available with the same arguments, e.g.
+        `await driver.get(url)` or `await driver.extract(spec)`. Calls are executed one at a
+        time in submission order, since a WebDriver session handles one command at a time.
+
+        Cancelling a call that has not started yet removes it from the queue. A call that is
+        already running cannot be interrupted: it finishes on the driver thread and its result
+        is dropped.
+
+        Use `await AsyncDriverManager.create(...)` or `async with AsyncDriverManager(...)` so
+        that the browser starts without blocking the event loop.
+        """
+        self.driver_kwargs = driver_kwargs
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="async-driver")
+        self.driver: DriverManager | None = None
+
+    @classmethod
+    async def create(cls, **driver_kwargs: Any) -> "AsyncDriverManager":
+        """Creates the wrapper and starts the browser on its thread."""
+        manager = cls(**driver_kwargs)
+        await manager.start()
+        return manager
+
+    async def start(self) -> None:
+        """Starts the browser on the driver thread if it is not running yet."""
+        if self.driver is None:
+            self.driver = await self.run(lambda: DriverManager(**self.driver_kwargs))
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Runs a callable on the driver thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def call(self, func: Callable[[DriverManager], Any]) -> Any:
+        """Runs a callable taking the DriverManager on the driver thread, for multi-step interactions."""
+        await self.start()
+        return await self.run(func, self.driver)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        attribute = getattr(DriverManager, name, None)
+        if not callable(attribute):
+            raise AttributeError(name)
+
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            await self.start()
+            return await self.run(getattr(self.driver, name), *args, **kwargs)
+
+        method.__name__ = name
+        method.__doc__ = attribute.__doc__
+        return method
+
+    async def wait(self, seconds: float) -> None:
+        """Pauses without blocking the event loop or the driver thread."""
+        logger.info(f"Waiting for {seconds} seconds...")
+        await asyncio.sleep(seconds)
+
+    async def quit_driver(self) -> None:
+        """Quits the browser and stops the driver thread."""
+        if self.driver is not None:
+            await self.run(self.driver.quit_driver)
+            self.driver = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.quit_driver()
+
+
+class AsyncDriverPool:
+    def __init__(self, **pool_kwargs: Any) -> None:
+        """
+        Exposes a DriverPool to asyncio code.
+
+        Tasks are plain synchronous callables taking a DriverManager, run on the pool's
+        driver threads. Cancelling a task that is still queued removes it from the queue.
+        """
+        self.pool_kwargs = pool_kwargs
+        self.pool: DriverPool | None = None
+
+    async def start(self) -> None:
+        """Starts the pool without blocking the event loop."""
+        if self.pool is None:
+            self.pool = await asyncio.get_running_loop().run_in_executor(None, lambda: DriverPool(**self.pool_kwargs))
+
+    async def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Queues a page task and waits for its result."""
+        await self.start()
+        return await asyncio.wrap_future(self.pool.submit(func, *args, **kwargs))
+
+    async def map(self, func: Callable[..., Any], items: Iterable[Any]) -> List[Any]:
+        """Runs the task once per item concurrently, returning exceptions in place of failed results."""
+        return await asyncio.gather(*(self.submit(func, item) for item in items), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Waits for the queued tasks and closes the pool."""
+        if self.pool is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.pool.close)
+            self.pool = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
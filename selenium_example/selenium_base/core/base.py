@@ -1,9 +1,13 @@
 import atexit
+import json
 import logging
+import psutil
+import shutil
+import tempfile
 import urllib3
 import time
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Callable, List, Literal, Mapping, Optional, Type, TypeVar
 from selenium.common.exceptions import (
     NoSuchElementException,
     TimeoutException,
@@ -14,17 +18,27 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from tenacity import (
     before_sleep_log,
     retry,
+    retry_if_exception,
     retry_if_exception_type,
     stop_after_attempt,
     wait_fixed
 )
+from pydantic import BaseModel
 from urllib3.exceptions import MaxRetryError, NewConnectionError
-from webdriver_manager.chrome import ChromeDriverManager
 
+from selenium_base.core.blocking import BlockingPolicy
+from selenium_base.core.browser_cache import BrowserCache
+from selenium_base.core.cookie_store import CookieStore
+from selenium_base.core.extract import FieldSpec, normalize_spec
+from selenium_base.core.driver_cache import RefreshPolicy, resolve_driver_path
 from selenium_base.core.logger import logger
+from selenium_base.core.network import NetworkCapture
+from selenium_base.core.scripts import EXTRACT, INSTALL_REQUEST_TRACKER, WAIT_FOR_QUIET
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 logging.getLogger('selenium.webdriver.remote.remote_connection').setLevel(logging.ERROR)
@@ -32,17 +46,75 @@ logging.getLogger('urllib3.util.retry').setLevel(logging.ERROR)
 logging.getLogger('urllib3.connectionpool').setLevel(logging.ERROR)
 http = urllib3.PoolManager(retries=False)
 
+READY_STATES = {"none": (), "eager": ("interactive", "complete"), "normal": ("complete",)}
+LOOKUP_CONDITIONS = {
+    "present": EC.presence_of_element_located,
+    "visible": EC.visibility_of_element_located,
+    "clickable": EC.element_to_be_clickable,
+}
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+_log_before_sleep = before_sleep_log(logger, logging.WARNING)
+
+
+def _is_transient(exception: BaseException) -> bool:
+    """Returns True for driver errors worth retrying, i.e. not a missing element or an expired wait."""
+    return isinstance(exception, WebDriverException) and not isinstance(exception, (NoSuchElementException, TimeoutException))
+
+
+def _count_retry(retry_state) -> None:
+    """Counts a retry on the DriverManager being retried, then logs it."""
+    retry_state.args[0].lookup_stats["retries"] += 1
+    _log_before_sleep(retry_state)
+
 
 class DriverManager:
-    def __init__(self, headless: bool = True, implicit_wait: int = 10, page_load_timeout: int = 30) -> None:
+    def __init__(
+        self,
+        headless: bool = True,
+        implicit_wait: int = 10,
+        page_load_timeout: int = 30,
+        cookie_store: Optional[CookieStore] = None,
+        driver_refresh: RefreshPolicy = "auto",
+        profile_template: Optional[Path | str] = None,
+        blocking_policy: Optional[BlockingPolicy] = None,
+        network_capture: Optional[NetworkCapture] = None,
+        max_rss_mb: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        browser_cache: Optional[BrowserCache] = None,
+        page_load_strategy: Literal["normal", "eager", "none"] = "normal",
+    ) -> None:
         self.headless = headless
         self.implicit_wait = implicit_wait
         self.page_load_timeout = page_load_timeout
+        self.cookie_store = cookie_store
+        self.driver_refresh = driver_refresh
+        self.profile_template = Path(profile_template) if profile_template else None
+        self.profile_dir: Optional[str] = None
+        self.startup_timings: dict = {}
+        self.blocking_policy = blocking_policy
+        self.network_capture = network_capture
+        self.last_page_stats: dict = {}
+        self.lookup_stats = {"lookups": 0, "polls": 0, "timeouts": 0, "retries": 0, "seconds": 0.0}
+        self._current_implicit_wait = implicit_wait
+        self.max_rss_mb = max_rss_mb
+        self.max_pages = max_pages
+        self.pages_loaded = 0
+        self.recycles = 0
+        self.browser_cache = browser_cache
+        self.cache_slot: Optional[Path] = None
+        self.page_load_strategy = page_load_strategy
         self.driver = self._initialize_driver()
+        if self.cookie_store:
+            self.load_cookies()
         atexit.register(self.quit_driver)
 
     def _initialize_driver(self):
-        """Initializes the ChromeDriver using webdriver_manager."""
+        """
+        Initializes the ChromeDriver, resolving the binary through the on-disk driver cache.
+        When a profile template is set, a copy of it is used as the user data dir so the
+        browser starts with a warm profile.
+        """
+        start = time.perf_counter()
         options = Options()
         if self.headless:
             options.add_argument('--headless')
@@ -50,37 +122,335 @@ class DriverManager:
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
+        if self.profile_template:
+            self.profile_dir = tempfile.mkdtemp(prefix="chrome-profile-")
+            shutil.copytree(self.profile_template, self.profile_dir, dirs_exist_ok=True)
+            options.add_argument(f"--user-data-dir={self.profile_dir}")
+        if self.browser_cache:
+            self.cache_slot = self.browser_cache.acquire()
+            for argument in self.browser_cache.arguments(self.cache_slot) if self.cache_slot else []:
+                options.add_argument(argument)
+        options.page_load_strategy = self.page_load_strategy
+        if self.blocking_policy:
+            self.blocking_policy.apply_options(options)
+        if self.network_capture:
+            self.network_capture.apply_options(options)
+        self.startup_timings["prepare"] = time.perf_counter() - start
+
+        service = Service(resolve_driver_path(self.driver_refresh))
+        self.startup_timings["resolve"] = time.perf_counter() - start - self.startup_timings["prepare"]
 
-        service = Service(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=options)
         driver.implicitly_wait(self.implicit_wait)
         driver.set_page_load_timeout(self.page_load_timeout)
+        if self.blocking_policy:
+            self.blocking_policy.apply(driver)
+        if self.network_capture:
+            self.network_capture.apply(driver)
+        self.startup_timings["total"] = time.perf_counter() - start
+        self.startup_timings["launch"] = (
+            self.startup_timings["total"] - self.startup_timings["prepare"] - self.startup_timings["resolve"]
+        )
+        logger.info(
+            "Browser started in {total:.2f}s (prepare {prepare:.2f}s, resolve {resolve:.2f}s, launch {launch:.2f}s)".format(
+                **self.startup_timings
+            )
+        )
         return driver
     
+    def set_cookies(self, cookies: List[dict]) -> None:
+        """Sets cookies in the Selenium dict format for all domains at once, without navigating."""
+        cookies = [
+            {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": cookie["domain"],
+                "path": cookie.get("path") or "/",
+                "secure": cookie.get("secure", False),
+                "httpOnly": cookie.get("httpOnly", False),
+                **({"expires": cookie["expiry"]} if cookie.get("expiry") else {}),
+            }
+            for cookie in cookies
+        ]
+        if cookies:
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+    def load_cookies(self) -> None:
+        """Seeds the browser with the unexpired cookies of the cookie store, for all domains at once."""
+        cookies = self.cookie_store.all()
+        self.set_cookies(cookies)
+        logger.info(f"Loaded {len(cookies)} cookies into the browser")
+
+    def get_all_cookies(self) -> List[dict]:
+        """Returns the cookies of every domain visited by the browser, in the Selenium dict format."""
+        cookies = self.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        return [
+            {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": cookie["domain"],
+                "path": cookie["path"],
+                "expiry": cookie["expires"] if cookie.get("expires", -1) > 0 else None,
+                "secure": cookie.get("secure", False),
+                "httpOnly": cookie.get("httpOnly", False),
+            }
+            for cookie in cookies
+        ]
+
+    def save_cookies(self) -> None:
+        """Writes the cookies of every domain visited by the browser back to the cookie store."""
+        self.cookie_store.update(self.get_all_cookies())
+        self.cookie_store.save()
+
     def quit_driver(self):
-        """Closes the driver safely."""
+        """Closes the driver safely, saving its cookies first when a cookie store is set."""
         if self.driver:
+            self.log_lookup_stats()
             try:
+                if self.cookie_store:
+                    self.save_cookies()
                 self.driver.quit()
             except (WebDriverException, MaxRetryError, NewConnectionError) as e:
                 logger.error(f"Error while quitting WebDriver: {e}")
         else:
             logger.warning("No WebDriver instance to quit.")
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self.profile_dir = None
+        if self.cache_slot:
+            self.browser_cache.release(self.cache_slot)
+            self.cache_slot = None
 
     retry_decorator = retry(
         stop=stop_after_attempt(3),
         wait=wait_fixed(5),
         retry=retry_if_exception_type((NoSuchElementException, TimeoutException, WebDriverException)),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
+        before_sleep=_count_retry,
         reraise=True
     )
+    # Element methods wait explicitly for the element, so a missing one fails once after
+    # `implicit_wait` seconds; only transient errors such as stale elements are retried
+    element_retry_decorator = retry(
+        stop=stop_after_attempt(3),
+        wait=wait_fixed(1),
+        retry=retry_if_exception(_is_transient),
+        before_sleep=_count_retry,
+        reraise=True
+    )
+
+    def _set_implicit_wait(self, seconds: float) -> None:
+        """Sets the implicit wait, skipping the WebDriver call when it is already in effect."""
+        if self._current_implicit_wait != seconds:
+            self.driver.implicitly_wait(seconds)
+            self._current_implicit_wait = seconds
+
+    # Memory management
+    def browser_rss_mb(self) -> float:
+        """
+        Returns the resident memory of the chromedriver process tree, Chrome included, in MB.
+        Shared pages are counted once per process, so this overestimates the real footprint.
+        """
+        try:
+            root = psutil.Process(self.driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+        except (AttributeError, psutil.Error):
+            return 0.0
+        rss = 0
+        for process in processes:
+            try:
+                rss += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return rss / (1024 * 1024)
+
+    def recycle(self) -> None:
+        """
+        Restarts the browser, carrying the cookies of every domain over to the new one.
+        """
+        cookies = self.get_all_cookies()
+        self.quit_driver()
+        self.driver = self._initialize_driver()
+        self._current_implicit_wait = self.implicit_wait
+        self.set_cookies(cookies)
+        self.pages_loaded = 0
+        self.recycles += 1
+        logger.info(f"Browser recycled with {len(cookies)} cookies")
+
+    def recycle_if_needed(self) -> bool:
+        """
+        Recycles the browser once it loaded `max_pages` pages or its process tree exceeds `max_rss_mb`.
+
+        Returns:
+            bool: True if the browser was recycled.
+        """
+        if self.max_pages and self.pages_loaded >= self.max_pages:
+            logger.info(f"Recycling browser after {self.pages_loaded} pages")
+        elif self.max_rss_mb and (rss := self.browser_rss_mb()) > self.max_rss_mb:
+            logger.info(f"Recycling browser using {rss:.0f} MB")
+        else:
+            return False
+        self.recycle()
+        return True
+
+    def read_performance_log(self) -> List[dict]:
+        """
+        Drains the Chrome performance log and returns its CDP messages.
+
+        The network capture, if any, processes the messages first, so calling this after
+        scrolling or clicking also captures the responses those actions triggered.
+        """
+        messages = [json.loads(entry["message"])["message"] for entry in self.driver.get_log("performance")]
+        if self.network_capture:
+            self.network_capture.process(self.driver, messages)
+        return messages
 
     @retry_decorator
-    def get(self, url: str) -> None:
-        """Navigates to a specified URL with retries."""
-        logger.info(f"Navigating to {url}...")
+    def _navigate(self, url: str, strategy: Optional[str], timeout: float) -> None:
+        """Loads a URL and waits for the document ready state of the strategy, retrying failed and timed-out loads."""
         self.driver.get(url)
-    
+        states = READY_STATES[strategy or self.page_load_strategy]
+        if states and self.page_load_strategy != "normal" and states != READY_STATES[self.page_load_strategy]:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda driver: driver.execute_script("return document.readyState") in states
+            )
+
+    def get(
+        self,
+        url: str,
+        strategy: Optional[Literal["normal", "eager", "none"]] = None,
+        ready: Optional[tuple | Callable[[Any], Any]] = None,
+        ready_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Navigates to a specified URL, retrying the page load.
+        A readiness condition that never holds fails after a single wait.
+
+        Args:
+            strategy (Optional[str]): Page-load strategy for this call. Weaker strategies than the
+                session's `page_load_strategy` have no effect, since the driver already waited;
+                start the session with "none" to choose freely per call.
+            ready (Optional[tuple | Callable]): Explicit readiness condition waited for after
+                navigation, either a (By, value) locator or a callable taking the WebDriver.
+            ready_timeout (Optional[float]): Seconds to wait for the strategy and the readiness
+                condition. Defaults to `page_load_timeout`.
+        """
+        self.recycle_if_needed()
+        logger.info(f"Navigating to {url}...")
+        self.pages_loaded += 1
+        if self.blocking_policy or self.network_capture:
+            self.read_performance_log()
+        timeout = ready_timeout or self.page_load_timeout
+        self._navigate(url, strategy, timeout)
+        if ready is not None:
+            self._wait_until_ready(ready, timeout)
+        if self.blocking_policy or self.network_capture:
+            messages = self.read_performance_log()
+        if self.blocking_policy:
+            self.last_page_stats = self.blocking_policy.page_stats(messages)
+            logger.info(
+                f"Blocked {self.last_page_stats['blocked_requests']} requests "
+                f"{self.last_page_stats['blocked_by_type']} on {url}, "
+                f"transferred {self.last_page_stats['transferred_bytes']} bytes"
+            )
+
+    def _wait_until_ready(self, ready: tuple | Callable[[Any], Any], timeout: float) -> None:
+        """Waits for the readiness condition without the implicit wait."""
+        condition = EC.presence_of_element_located(ready) if isinstance(ready, tuple) else ready
+        previous_wait = self._current_implicit_wait
+        self._set_implicit_wait(0)
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(condition)
+        finally:
+            self._set_implicit_wait(previous_wait)
+
+    # Tab multiplexing
+    def map_tabs(
+        self,
+        urls: List[str],
+        func: Callable[["DriverManager"], Any],
+        tabs: int = 4,
+        timeout: Optional[float] = None,
+        poll_frequency: float = 0.1,
+        batch_size: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Loads the URLs in up to `tabs` tabs of this browser at once and runs `func` on each loaded page.
+
+        Navigation is started without waiting in every tab, then the tabs are polled and `func`
+        is called with this DriverManager, switched to the tab, as soon as its page is loaded.
+        This is far cheaper per concurrent page than one browser each.
+
+        The URLs are processed in batches of `batch_size`, `tabs * 5` by default, and the
+        `max_pages` and `max_rss_mb` thresholds are checked before each batch, once its tabs are closed.
+
+        Returns:
+            List[Any]: The result of `func` per URL, in order, with exceptions in place of failures.
+        """
+        timeout = timeout or self.page_load_timeout
+        batch_size = batch_size or tabs * 5
+        results: List[Any] = []
+        for start in range(0, len(urls), batch_size):
+            self.recycle_if_needed()
+            results.extend(self._map_tab_batch(urls[start:start + batch_size], func, tabs, timeout, poll_frequency))
+        return results
+
+    def _map_tab_batch(
+        self,
+        urls: List[str],
+        func: Callable[["DriverManager"], Any],
+        tabs: int,
+        timeout: float,
+        poll_frequency: float,
+    ) -> List[Any]:
+        """Runs one batch of `map_tabs`, closing the extra tabs it opened."""
+        original = self.driver.current_window_handle
+        handles = [original]
+        for _ in range(min(tabs, len(urls)) - 1):
+            self.driver.switch_to.new_window("tab")
+            handles.append(self.driver.current_window_handle)
+
+        pending = iter(enumerate(urls))
+        active = {}
+        results: List[Any] = [None] * len(urls)
+
+        def load(handle: str) -> None:
+            item = next(pending, None)
+            if item is None:
+                return
+            self.driver.switch_to.window(handle)
+            self.driver.execute_script("window.__tabLoading = true; window.location.href = arguments[0];", item[1])
+            self.pages_loaded += 1
+            active[handle] = (item[0], item[1], time.perf_counter())
+
+        logger.info(f"Loading {len(urls)} URLs in {len(handles)} tabs")
+        try:
+            for handle in handles:
+                load(handle)
+            while active:
+                for handle in list(active):
+                    index, url, started = active[handle]
+                    self.driver.switch_to.window(handle)
+                    loaded = self.driver.execute_script("return !window.__tabLoading && document.readyState === 'complete';")
+                    if not loaded and time.perf_counter() - started < timeout:
+                        continue
+                    if not loaded:
+                        results[index] = TimeoutException(f"Timed out loading {url} after {timeout}s")
+                    else:
+                        try:
+                            results[index] = func(self)
+                        except Exception as e:
+                            results[index] = e
+                    del active[handle]
+                    load(handle)
+                if active:
+                    time.sleep(poll_frequency)
+        finally:
+            for handle in handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(original)
+        return results
+
     def wait(self, seconds: float) -> None:
         """Pauses execution for a specified number of seconds."""
         logger.info(f"Waiting for {seconds} seconds...")
@@ -104,36 +474,136 @@ class DriverManager:
         logger.info("Navigating forward in history...")
         self.driver.forward()
 
-    @retry_decorator
+    def _locate(self, by: By, value: str, condition: Literal["present", "visible", "clickable"] = "present") -> WebElement:
+        """
+        Waits up to `implicit_wait` seconds for an element through `find`.
+
+        Raises:
+            NoSuchElementException: If the element did not meet the condition in time.
+        """
+        try:
+            return self.find(by, value, timeout=self.implicit_wait, condition=condition)
+        except TimeoutException as e:
+            raise NoSuchElementException(f"No {condition} element by {by} with value '{value}' after {self.implicit_wait}s") from e
+
+    @element_retry_decorator
     def find_element(self, by: By, value: str) -> WebElement:
-        """Finds an element on the page with retries."""
+        """Finds an element on the page, waiting up to `implicit_wait` seconds for it."""
         logger.info(f"Finding element by {by} with value '{value}'")
-        return self.driver.find_element(by, value)
+        return self._locate(by, value)
 
-    @retry_decorator
+    @element_retry_decorator
     def find_elements(self, by: By, value: str) -> List[WebElement]:
-        """Finds multiple elements on the page with retries."""
+        """Finds multiple elements on the page, waiting up to `implicit_wait` seconds for the first one."""
         logger.info(f"Finding elements by {by} with value '{value}'")
-        return self.driver.find_elements(by, value)
+        return self.find_all(by, value, timeout=self.implicit_wait)
 
-    @retry_decorator
+    # Explicit-wait lookups
+    def find(
+        self,
+        by: By,
+        value: str,
+        timeout: float = 10,
+        poll_frequency: float = 0.25,
+        optional: bool = False,
+        condition: Literal["present", "visible", "clickable"] = "present",
+    ) -> Optional[WebElement]:
+        """
+        Finds an element with an explicit wait instead of the implicit wait and retries.
+
+        Args:
+            timeout (float): Seconds to wait for the element.
+            poll_frequency (float): Seconds between two lookups.
+            optional (bool): Return None instead of raising when the element does not show up.
+            condition (str): Wait for the element to be present, visible or clickable.
+
+        Raises:
+            TimeoutException: If the element did not meet the condition in time and is not optional.
+        """
+        locate = LOOKUP_CONDITIONS[condition]((by, value))
+        polls = 0
+
+        def poll(driver) -> Any:
+            nonlocal polls
+            polls += 1
+            return locate(driver)
+
+        previous_wait = self._current_implicit_wait
+        self._set_implicit_wait(0)
+        start = time.perf_counter()
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency).until(poll)
+        except TimeoutException:
+            self.lookup_stats["timeouts"] += 1
+            if optional:
+                logger.info(f"Optional element by {by} with value '{value}' not found after {timeout}s")
+                return None
+            raise
+        finally:
+            self._set_implicit_wait(previous_wait)
+            self.lookup_stats["lookups"] += 1
+            self.lookup_stats["polls"] += polls
+            self.lookup_stats["seconds"] += time.perf_counter() - start
+
+    def find_optional(self, by: By, value: str, timeout: float = 0, **kwargs: Any) -> Optional[WebElement]:
+        """Finds an element that may be absent, returning None right away by default."""
+        return self.find(by, value, timeout=timeout, optional=True, **kwargs)
+
+    def find_all(self, by: By, value: str, timeout: float = 0, poll_frequency: float = 0.25, min_count: int = 1) -> List[WebElement]:
+        """
+        Finds the elements matching the locator, waiting up to `timeout` seconds for `min_count` of them.
+        Returns whatever matched when the timeout is reached instead of raising.
+        """
+        elements: List[WebElement] = []
+        polls = 0
+
+        def enough(driver) -> bool:
+            nonlocal elements, polls
+            polls += 1
+            elements = driver.find_elements(by, value)
+            return len(elements) >= min_count
+
+        previous_wait = self._current_implicit_wait
+        self._set_implicit_wait(0)
+        start = time.perf_counter()
+        try:
+            if not enough(self.driver) and timeout > 0:
+                WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency).until(enough)
+        except TimeoutException:
+            self.lookup_stats["timeouts"] += 1
+        finally:
+            self._set_implicit_wait(previous_wait)
+            self.lookup_stats["lookups"] += 1
+            self.lookup_stats["polls"] += polls
+            self.lookup_stats["seconds"] += time.perf_counter() - start
+        return elements
+
+    def log_lookup_stats(self) -> None:
+        """Logs how many lookups, polls, timeouts and retries this driver has made."""
+        stats = self.lookup_stats
+        logger.info(
+            f"Lookups: {stats['lookups']}, polls: {stats['polls']}, timeouts: {stats['timeouts']}, "
+            f"retries: {stats['retries']}, time spent waiting: {stats['seconds']:.2f}s"
+        )
+
+    @element_retry_decorator
     def click_element(self, by: By, value: str) -> None:
-        """Finds and clicks an element on the page with retries."""
-        element = self.find_element(by, value)
+        """Waits for an element to be clickable and clicks it, retrying transient errors."""
+        element = self._locate(by, value, "clickable")
         logger.info(f"Clicking element with {by}='{value}'")
         element.click()
 
-    @retry_decorator
+    @element_retry_decorator
     def send_keys_to_element(self, by: By, value: str, keys: str) -> None:
-        """Finds an element and sends keys to it with retries."""
-        element = self.find_element(by, value)
+        """Finds an element and sends keys to it, retrying transient errors."""
+        element = self._locate(by, value)
         logger.info(f"Sending keys to element with {by}='{value}'")
         element.send_keys(keys)
 
-    @retry_decorator
+    @element_retry_decorator
     def clear_element(self, by: By, value: str) -> None:
-        """Clears text from an input field with retries."""
-        element = self.find_element(by, value)
+        """Clears text from an input field, retrying transient errors."""
+        element = self._locate(by, value)
         logger.info(f"Clearing element with {by}='{value}'")
         element.clear()
 
@@ -144,6 +614,30 @@ class DriverManager:
         logger.info(f"Executing script: {script}")
         return self.driver.execute_script(script, *args)
 
+    # Batch extraction
+    @retry_decorator
+    def extract(self, spec: Mapping[str, FieldSpec], schema: Optional[Type[SchemaType]] = None) -> dict | SchemaType:
+        """
+        Extracts every field of the spec in a single script call.
+
+        The spec maps field names to CSS or XPath selectors, see `normalize_field` for the
+        accepted forms. With a schema, the extracted data is validated into it.
+
+        Example:
+            driver.extract({
+                "title": "h1",
+                "next_page": "a.next@href",
+                "products": [{"selector": "div.product", "fields": {"name": "h2", "price": ".price"}}],
+            })
+
+        Raises:
+            pydantic.ValidationError: If the extracted data does not match the schema.
+        """
+        start = time.perf_counter()
+        data = self.driver.execute_script(EXTRACT, normalize_spec(spec))
+        logger.info(f"Extracted {len(data)} fields in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return schema.model_validate(data) if schema else data
+
     def close_window(self) -> None:
         """Closes the current window."""
         logger.info("Closing the current window...")
@@ -152,19 +646,91 @@ class DriverManager:
         except (WebDriverException, MaxRetryError, NewConnectionError) as e:
             logger.error(f"Error while closing window: {e}")
 
+    # Waiting on page conditions
+    def _wait_for_quiet(
+        self,
+        quiet: float,
+        timeout: float,
+        network: bool = False,
+        growth: bool = False,
+        scroll: bool = False,
+    ) -> dict:
+        """Runs the in-page quiet/growth wait in a single async script call."""
+        if network:
+            self.driver.execute_script(INSTALL_REQUEST_TRACKER)
+        self.driver.set_script_timeout(timeout + 5)
+        return self.driver.execute_async_script(WAIT_FOR_QUIET, quiet * 1000, timeout * 1000, network, growth, scroll)
+
+    def wait_for_dom_quiet(self, quiet: float = 0.5, timeout: float = 10) -> bool:
+        """
+        Waits until the DOM has not changed for `quiet` seconds.
+
+        Returns:
+            bool: False if `timeout` was reached first.
+        """
+        result = self._wait_for_quiet(quiet, timeout)
+        logger.info(f"DOM quiet after {result['elapsed']:.0f} ms" + (" (timed out)" if result["timedOut"] else ""))
+        return not result["timedOut"]
+
+    def wait_for_network_idle(self, quiet: float = 0.5, timeout: float = 10) -> bool:
+        """
+        Waits until there has been no pending fetch/XHR request and no DOM change for `quiet` seconds.
+
+        Only requests started after the first call on the current document are tracked.
+
+        Returns:
+            bool: False if `timeout` was reached first.
+        """
+        result = self._wait_for_quiet(quiet, timeout, network=True)
+        logger.info(f"Network idle after {result['elapsed']:.0f} ms" + (" (timed out)" if result["timedOut"] else ""))
+        return not result["timedOut"]
+
+    def wait_for_element_count(self, by: By, value: str, count: int, timeout: float = 10, poll_frequency: float = 0.1) -> int:
+        """
+        Waits until at least `count` elements match the locator.
+
+        Returns:
+            int: The number of matching elements, which is below `count` if `timeout` was reached.
+        """
+        found = 0
+
+        def enough(driver) -> bool:
+            nonlocal found
+            found = len(driver.find_elements(by, value))
+            return found >= count
+
+        logger.info(f"Waiting for {count} elements by {by} with value '{value}'")
+        self._set_implicit_wait(0)
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency).until(enough)
+        except TimeoutException:
+            logger.warning(f"Found {found} of {count} elements by {by} with value '{value}' after {timeout}s")
+        return found
+
     # Scrolling
     @retry_decorator
-    def scroll_to_bottom(self) -> None:
-        """Scrolls to the bottom of the page."""
+    def scroll_to_bottom(self, quiet: float = 1.0, step_timeout: float = 10, max_scrolls: int = 100) -> int:
+        """
+        Scrolls to the bottom of the page until it stops growing.
+
+        Each step scrolls and returns as soon as the page height grows. When it does not grow,
+        the step waits for the DOM and the network to be quiet for `quiet` seconds, at most
+        `step_timeout`, and scrolling stops if the height is still unchanged.
+
+        Returns:
+            int: The number of scroll steps that made the page grow.
+        """
         logger.info("Scrolling to the bottom of the page...")
-        last_height = self.execute_script("return document.body.scrollHeight")
-        while True:
-            self.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)  # Wait for page to load
-            new_height = self.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
+        start = time.perf_counter()
+        for step in range(max_scrolls):
+            result = self._wait_for_quiet(quiet, step_timeout, network=True, growth=True, scroll=True)
+            if not result["grown"]:
                 break
-            last_height = new_height
+        else:
+            logger.warning(f"Stopped scrolling after {max_scrolls} steps")
+            step = max_scrolls
+        logger.info(f"Reached the bottom after {step} scrolls in {time.perf_counter() - start:.2f}s")
+        return step
 
     @retry_decorator
     def accept_alert(self) -> None:
@@ -181,10 +747,10 @@ class DriverManager:
         alert.dismiss()
 
     # File upload
-    @retry_decorator
+    @element_retry_decorator
     def upload_file(self, by: By, value: str, file_path: Path | str) -> None:
         """Uploads a file by sending the file path to the input element."""
         logger.info(f"Uploading file '{file_path}' to element with {by}='{value}'")
-        element = self.find_element(by, value)
+        element = self._locate(by, value)
         element.send_keys(file_path)
 
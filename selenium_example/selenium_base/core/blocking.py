@@ -0,0 +1,111 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List
+
+from selenium.webdriver.chrome.options import Options
+
+from selenium_base.core.logger import logger
+
+RESOURCE_TYPE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    # HLS segments (.ts) are left out: blocking the .m3u8 playlist already stops them, and
+    # ".ts" also matches paths such as /app.tsx
+    "media": ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav", "*.m3u8", "*.mov"],
+    "stylesheet": ["*.css"],
+}
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "scorecardresearch.com",
+    "adservice.google.com",
+)
+
+
+class BlockingPolicy:
+    def __init__(
+        self,
+        resource_types: Iterable[str] = ("image", "font", "media"),
+        url_patterns: Iterable[str] = (),
+        blocked_domains: Iterable[str] = TRACKER_DOMAINS,
+    ) -> None:
+        """
+        Describes which requests the browser should never make.
+
+        Args:
+            resource_types (Iterable[str]): Resource types to block: image, font, media and/or stylesheet.
+            url_patterns (Iterable[str]): Extra CDP URL patterns, `*` being the only wildcard.
+            blocked_domains (Iterable[str]): Third-party domains whose requests are blocked entirely.
+                Defaults to common analytics and ad trackers.
+        """
+        self.resource_types = set(resource_types)
+        unknown = self.resource_types - RESOURCE_TYPE_PATTERNS.keys()
+        if unknown:
+            raise ValueError(f"Unsupported resource types: {', '.join(sorted(unknown))}")
+        self.url_patterns = list(url_patterns)
+        self.blocked_domains = list(blocked_domains)
+
+    @property
+    def blocked_urls(self) -> List[str]:
+        """Returns the URL patterns passed to Network.setBlockedURLs."""
+        # Chrome looks for the parts between wildcards in order anywhere in the URL, so "*.mov"
+        # alone would block www.movies.com; the "*://*/" prefix only lets the extension match
+        # after the first slash of the path. The "?*" variant keeps query strings covered should
+        # the pattern have to match the whole URL.
+        patterns = [
+            variant
+            for resource_type in sorted(self.resource_types)
+            for pattern in RESOURCE_TYPE_PATTERNS[resource_type]
+            for variant in (f"*://*/{pattern}", f"*://*/{pattern}?*")
+        ]
+        patterns += [f"*://{domain}/*" for domain in self.blocked_domains]
+        patterns += [f"*.{domain}/*" for domain in self.blocked_domains]
+        return patterns + self.url_patterns
+
+    def apply_options(self, options: Options) -> None:
+        """
+        Sets the Chrome prefs and logging needed before the browser starts.
+
+        Images are also disabled through content settings so that the renderer does not
+        even try to decode them, and performance logging is enabled so that blocked
+        requests can be counted per page.
+        """
+        if "image" in self.resource_types:
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    def apply(self, driver: Any) -> None:
+        """Installs the URL blocklist in a running browser through CDP."""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+        logger.info(f"Blocking {len(self.blocked_urls)} URL patterns")
+
+    @staticmethod
+    def page_stats(messages: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Summarizes the performance log messages of a page load.
+
+        Returns:
+            Dict[str, Any]: Transferred bytes, number of blocked requests and blocked requests per resource type.
+        """
+        resource_types: Dict[str, str] = {}
+        blocked: Counter = Counter()
+        transferred = 0
+        for message in messages:
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                resource_types[params["requestId"]] = params.get("type", "Other")
+            elif method == "Network.loadingFinished":
+                transferred += int(params.get("encodedDataLength", 0))
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked[params.get("type") or resource_types.get(params["requestId"], "Other")] += 1
+        return {
+            "transferred_bytes": transferred,
+            "blocked_requests": sum(blocked.values()),
+            "blocked_by_type": dict(blocked),
+        }
@@ -0,0 +1,88 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from selenium_base.core.logger import logger
+
+LOCK_FILE = ".lock"
+
+
+class BrowserCache:
+    def __init__(self, path: Path | str, size_mb: int = 512, max_slots: int = 8) -> None:
+        """
+        Manages reusable on-disk Chrome cache directories.
+
+        Chrome's disk cache cannot be shared by two running browsers, so the cache is split
+        into slots. Each DriverManager locks one slot for its lifetime; a new slot is seeded
+        with a copy of the first slot so that pooled drivers start warm as well.
+
+        Args:
+            path (Path | str): Directory holding the cache slots.
+            size_mb (int): Disk cache size limit per slot, enforced by Chrome.
+            max_slots (int): Maximum number of slots; drivers beyond it run without a persistent cache.
+        """
+        self.path = Path(path)
+        self.size_mb = size_mb
+        self.max_slots = max_slots
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._locks: Dict[Path, int] = {}
+
+    def _slot(self, index: int) -> Path:
+        return self.path / f"slot-{index}"
+
+    def _try_lock(self, slot: Path) -> bool:
+        """
+        Locks a slot for this DriverManager.
+
+        The lock is an advisory lock on a file descriptor held open until `release`, so the
+        operating system drops it when the process dies and no stale lock has to be taken over.
+        """
+        slot.mkdir(parents=True, exist_ok=True)
+        fd = os.open(slot / LOCK_FILE, os.O_CREAT | os.O_RDWR)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return False
+        self._locks[slot] = fd
+        return True
+
+    def acquire(self) -> Optional[Path]:
+        """
+        Locks a free slot and returns its directory, or None when all slots are in use.
+        """
+        for index in range(self.max_slots):
+            slot = self._slot(index)
+            is_new = not slot.exists()
+            if not self._try_lock(slot):
+                continue
+            seed = self._slot(0)
+            if is_new and index > 0 and (seed / "Cache").exists():
+                shutil.copytree(seed, slot, dirs_exist_ok=True, ignore=shutil.ignore_patterns(LOCK_FILE))
+                logger.info(f"Seeded browser cache {slot} from {seed}")
+            return slot
+        logger.warning(f"All {self.max_slots} browser cache slots are in use")
+        return None
+
+    def release(self, slot: Path) -> None:
+        """Unlocks a slot acquired through this cache."""
+        fd = self._locks.pop(slot, None)
+        if fd is None:
+            return
+        if not fcntl:
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)
+
+    def arguments(self, slot: Path) -> list:
+        """Returns the Chrome arguments that point the disk cache at the slot."""
+        return [f"--disk-cache-dir={slot / 'Cache'}", f"--disk-cache-size={self.size_mb * 1024 * 1024}"]
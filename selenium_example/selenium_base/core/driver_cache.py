@@ -0,0 +1,85 @@
+import json
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Literal, Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+from selenium_base.core.logger import logger
+
+CACHE_FILE = Path(__file__).resolve().parent.parent.parent / ".cache" / "chromedriver.json"
+RefreshPolicy = Literal["never", "auto", "always"]
+
+_resolved: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def _driver_version(path: str) -> Optional[str]:
+    """Returns the version reported by the chromedriver binary."""
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+        return output.split()[1] if output else None
+    except (OSError, subprocess.SubprocessError, IndexError) as e:
+        logger.warning(f"Could not read chromedriver version: {e}")
+        return None
+
+
+def _read_cache(cache_file: Path) -> Optional[Dict[str, Any]]:
+    """Returns the cached resolution if it points to an existing binary."""
+    try:
+        cached = json.loads(cache_file.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not Path(cached.get("path", "")).is_file():
+        return None
+    return cached
+
+
+def _install(cache_file: Path) -> Dict[str, Any]:
+    """Resolves the driver through webdriver_manager and writes the result to the cache file."""
+    path = ChromeDriverManager().install()
+    resolved = {"path": path, "version": _driver_version(path), "resolved_at": time.time()}
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(resolved, indent=2))
+    except OSError as e:
+        logger.error(f"Error writing chromedriver cache: {e}")
+    return resolved
+
+
+def resolve_driver_path(
+    refresh: RefreshPolicy = "auto",
+    max_age: float = 7 * 24 * 3600,
+    cache_file: Path = CACHE_FILE,
+) -> str:
+    """
+    Returns the chromedriver path, memoized in-process and on disk.
+
+    Refresh policies:
+        never: use the cached binary whenever it exists, only resolving when there is none.
+        auto: re-resolve once the cache is older than `max_age`, keeping the cached binary
+            if webdriver_manager fails, e.g. without network.
+        always: re-resolve on every call, like calling ChromeDriverManager().install() directly.
+    """
+    with _lock:
+        if refresh != "always" and "path" in _resolved:
+            return _resolved["path"]
+
+        cached = _read_cache(cache_file)
+        stale = cached is None or time.time() - cached["resolved_at"] > max_age
+        if cached and (refresh == "never" or (refresh == "auto" and not stale)):
+            resolved = cached
+        else:
+            try:
+                resolved = _install(cache_file)
+                logger.info(f"Resolved chromedriver {resolved['version']} at {resolved['path']}")
+            except Exception as e:
+                if not cached:
+                    raise
+                logger.warning(f"Could not refresh chromedriver, using cached {cached['version']}: {e}")
+                resolved = cached
+
+        _resolved.update(resolved)
+        return resolved["path"]
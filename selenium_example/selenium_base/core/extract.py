@@ -0,0 +1,44 @@
+import re
+from typing import Any, Dict, List, Mapping, Union
+
+ATTR_SUFFIX = re.compile(r"^(?P<selector>.*[^/@\[\s])@(?P<attr>[A-Za-z_][\w\-]*)$")
+FieldSpec = Union[str, Mapping[str, Any], List[Any]]
+
+
+def normalize_field(field: FieldSpec) -> Dict[str, Any]:
+    """
+    Turns a field of an extraction spec into the {selector, attr, many, fields} form used in the page.
+
+    Accepted forms:
+        "h1.title": text of the first match.
+        "a.next@href": attribute of the first match. `@text`, `@html` and `@outer_html` are also supported.
+        ["li.tag"]: a one-element list extracts every match instead of the first.
+        {"selector": "div.item", "fields": {...}}: nested fields evaluated relative to the match.
+        {"selector": ..., "attr": ..., "many": ...}: the explicit form.
+    """
+    if isinstance(field, list):
+        if len(field) != 1:
+            raise ValueError("List fields must contain exactly one selector or spec")
+        return {**normalize_field(field[0]), "many": True}
+    if isinstance(field, str):
+        match = ATTR_SUFFIX.match(field)
+        if match:
+            return {"selector": match["selector"], "attr": match["attr"], "many": False}
+        return {"selector": field, "attr": "text", "many": False}
+    if isinstance(field, Mapping):
+        if "selector" not in field and "fields" not in field:
+            raise ValueError(f"Field spec needs a selector or nested fields: {field}")
+        normalized = {
+            "selector": field.get("selector"),
+            "attr": field.get("attr", "text"),
+            "many": bool(field.get("many", False)),
+        }
+        if "fields" in field:
+            normalized["fields"] = normalize_spec(field["fields"])
+        return normalized
+    raise TypeError(f"Unsupported field spec: {field!r}")
+
+
+def normalize_spec(spec: Mapping[str, FieldSpec]) -> Dict[str, Dict[str, Any]]:
+    """Normalizes every field of an extraction spec."""
+    return {name: normalize_field(field) for name, field in spec.items()}
@@ -0,0 +1,156 @@
+import asyncio
+import inspect
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from selenium_base.core.base import DriverManager
+from selenium_base.core.logger import logger
+
+EXPIRED_STATUS_CODES = frozenset({401, 403, 419, 440})
+SESSION_SCRIPT = """
+return {
+    userAgent: navigator.userAgent,
+    languages: navigator.languages,
+    origin: location.origin,
+    href: location.href,
+};
+"""
+
+
+class SessionHandoff:
+    def __init__(
+        self,
+        driver: DriverManager,
+        client: Any,
+        domains: Optional[Iterable[str]] = None,
+        refresh: Optional[Callable[[DriverManager], None]] = None,
+        expired_status_codes: Iterable[int] = EXPIRED_STATUS_CODES,
+        expired_markers: Iterable[str] = (),
+    ) -> None:
+        """
+        Hands a live browser session over to an HTTP client.
+
+        The client is duck-typed: an aio_http `AioHttpClientManager` or a tlsclient `HTTPClient`,
+        anything with `set_headers` and `set_cookies`, sync or async.
+
+        Args:
+            driver (DriverManager): The browser holding the logged-in or cleared session.
+            client (Any): The HTTP client the session is handed to.
+            domains (Optional[Iterable[str]]): Only hand over cookies of these domains and their subdomains.
+            refresh (Optional[Callable]): Called with the driver before re-syncing an expired session,
+                e.g. to log in again. Without it, the browser page is simply reloaded.
+            expired_status_codes (Iterable[int]): Status codes that mean the HTTP session expired.
+            expired_markers (Iterable[str]): Body substrings that mean the HTTP session expired,
+                such as a login form.
+        """
+        self.driver = driver
+        self.client = client
+        self.domains = [domain.lstrip(".") for domain in domains] if domains else None
+        self.refresh = refresh
+        self.expired_status_codes = frozenset(expired_status_codes)
+        self.expired_markers = tuple(expired_markers)
+        self.resyncs = 0
+        self._lock = threading.Lock()
+        self._resync_lock = asyncio.Lock()
+
+    def _matches_domain(self, cookie_domain: str) -> bool:
+        """Returns True if the cookie belongs to one of the configured domains."""
+        if not self.domains:
+            return True
+        cookie_domain = (cookie_domain or "").lstrip(".")
+        return any(cookie_domain == domain or cookie_domain.endswith(f".{domain}") or domain.endswith(f".{cookie_domain}") for domain in self.domains)
+
+    def export(self) -> Dict[str, Any]:
+        """
+        Exports the cookies, user agent and relevant headers of the browser session.
+
+        Returns:
+            Dict[str, Any]: `cookies` in the Selenium dict format and `headers` to send with them.
+        """
+        with self._lock:
+            session = self.driver.driver.execute_script(SESSION_SCRIPT)
+            cookies = [cookie for cookie in self.driver.get_all_cookies() if self._matches_domain(cookie["domain"])]
+        headers = {
+            "User-Agent": session["userAgent"],
+            "Accept-Language": ",".join(
+                language if i == 0 else f"{language};q={max(0.1, 1 - i / 10):.1f}"
+                for i, language in enumerate(session["languages"] or [])
+            ),
+        }
+        if session.get("origin") and session["origin"] != "null":
+            headers["Referer"] = session["href"]
+        headers = {key: value for key, value in headers.items() if value}
+        logger.info(f"Exported {len(cookies)} cookies from {urlparse(session.get('href') or '').netloc or 'browser'}")
+        return {"cookies": cookies, "headers": headers}
+
+    async def _call(self, method: str, *args: Any) -> None:
+        """Calls a client method, awaiting it if the client is async."""
+        result = getattr(self.client, method)(*args)
+        if inspect.isawaitable(result):
+            await result
+
+    async def handoff(self) -> Dict[str, Any]:
+        """Exports the browser session and applies it to the HTTP client."""
+        session = await asyncio.get_running_loop().run_in_executor(None, self.export)
+        await self._call("set_headers", session["headers"])
+        await self._call("set_cookies", session["cookies"])
+        return session
+
+    def is_expired(self, status_code: int, text: Optional[str] = None) -> bool:
+        """Returns True if the response shows that the handed-over session expired."""
+        if status_code in self.expired_status_codes:
+            return True
+        return bool(text) and any(marker in text for marker in self.expired_markers)
+
+    def _refresh_browser(self) -> None:
+        """Renews the session in the browser."""
+        with self._lock:
+            if self.refresh:
+                self.refresh(self.driver)
+            else:
+                self.driver.refresh()
+
+    async def resync(self, seen: Optional[int] = None) -> None:
+        """
+        Renews the session in the browser and hands it over again.
+
+        Args:
+            seen (Optional[int]): The `resyncs` count the caller's failed request was sent with.
+                Callers that saw the same expiry wait for a single re-sync instead of each running one.
+        """
+        seen = self.resyncs if seen is None else seen
+        async with self._resync_lock:
+            if self.resyncs != seen:
+                return
+            logger.warning("HTTP session expired, re-syncing from the browser")
+            await asyncio.get_running_loop().run_in_executor(None, self._refresh_browser)
+            await self.handoff()
+            self.resyncs += 1
+
+    async def _send(self, url: str, method: str, **kwargs: Any) -> Tuple[int, str, Any]:
+        """Sends a request through the client, returning the status code, body and raw response."""
+        if hasattr(self.client, "fetch"):
+            status_code, text = await self.client.fetch(url, method, **kwargs)
+            return status_code, text, text
+        response = await self.client.async_request(method, url, **kwargs)
+        return response.status_code, response.text, response
+
+    async def fetch(self, url: str, method: str = "GET", **kwargs: Any) -> Tuple[int, str, Any]:
+        """
+        Sends a request through the HTTP client, re-syncing once from the browser if the session expired.
+
+        Returns:
+            Tuple[int, str, Any]: The status code, the body and the client's raw response.
+        """
+        resyncs = self.resyncs
+        result = await self._send(url, method, **kwargs)
+        if not self.is_expired(result[0], result[1]):
+            return result
+        await self.resync(resyncs)
+        return await self._send(url, method, **kwargs)
+
+    async def multi_fetch(self, urls: List[str], method: str = "GET", **kwargs: Any) -> List[Any]:
+        """Fetches several URLs concurrently, returning exceptions in place of failed results."""
+        tasks = [self.fetch(url, method, **kwargs) for url in urls]
+        return await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,133 @@
+import json
+import queue
+from collections import deque
+from fnmatch import fnmatch
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+from selenium_base.core.logger import logger
+
+
+class NetworkCapture:
+    def __init__(
+        self,
+        url_patterns: Iterable[str] = (),
+        content_types: Iterable[str] = ("application/json",),
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        sink: Optional[queue.Queue] = None,
+        max_records: int = 1000,
+    ) -> None:
+        """
+        Captures the network traffic of a DriverManager from the Chrome performance log.
+
+        Metadata of every response is kept in `records`. Responses whose URL matches one of
+        `url_patterns` or whose MIME type starts with one of `content_types` also get their
+        body fetched, and are passed to `callback` and/or put on `sink`.
+
+        Args:
+            url_patterns (Iterable[str]): Glob patterns matched against the response URL.
+            content_types (Iterable[str]): MIME type prefixes whose bodies are captured.
+            callback (Optional[Callable]): Called with every captured response.
+            sink (Optional[queue.Queue]): Queue every captured response is put on.
+            max_records (int): Number of response metadata records kept in `records`.
+        """
+        self.url_patterns = list(url_patterns)
+        self.content_types = tuple(content_types)
+        self.callback = callback
+        self.sink = sink
+        self.records: Deque[Dict[str, Any]] = deque(maxlen=max_records)
+        self._requests: Dict[str, Dict[str, Any]] = {}
+        self._responses: Dict[str, Dict[str, Any]] = {}
+
+    def copy(self) -> "NetworkCapture":
+        """Returns a capture with the same settings, callback and sink but none of the recorded traffic."""
+        return NetworkCapture(self.url_patterns, self.content_types, self.callback, self.sink, self.records.maxlen)
+
+    def apply_options(self, options: Options) -> None:
+        """Enables the performance log the capture is read from."""
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    def apply(self, driver: Any) -> None:
+        """Enables the CDP Network domain in a running browser."""
+        driver.execute_cdp_cmd("Network.enable", {})
+
+    def matches(self, url: str, mime_type: str) -> bool:
+        """Returns True if the body of the response should be captured."""
+        if any(fnmatch(url, pattern) for pattern in self.url_patterns):
+            return True
+        return bool(self.content_types) and (mime_type or "").startswith(self.content_types)
+
+    def _emit(self, record: Dict[str, Any]) -> None:
+        """Passes a captured response to the callback and the sink."""
+        if self.callback:
+            try:
+                self.callback(record)
+            except Exception as e:
+                logger.error(f"Error in network capture callback: {e}")
+        if self.sink is not None:
+            self.sink.put(record)
+
+    def _fetch_body(self, driver: Any, record: Dict[str, Any]) -> None:
+        """Adds the response body to the record, parsing JSON bodies."""
+        try:
+            response = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": record["request_id"]})
+        except WebDriverException as e:
+            logger.warning(f"Could not get response body for {record['url']}: {e.msg}")
+            return
+        record["body"] = response.get("body")
+        record["base64_encoded"] = response.get("base64Encoded", False)
+        if not record["base64_encoded"] and "json" in (record["mime_type"] or ""):
+            try:
+                record["json"] = json.loads(record["body"])
+            except (TypeError, json.JSONDecodeError):
+                pass
+
+    def process(self, driver: Any, messages: Iterable[Dict[str, Any]]) -> int:
+        """
+        Processes CDP messages read from the performance log.
+
+        Bodies have to be fetched before the page navigates away, so this is called by
+        DriverManager whenever it reads the performance log.
+
+        Returns:
+            int: The number of responses captured with their body.
+        """
+        captured = 0
+        for message in messages:
+            method, params = message.get("method"), message.get("params", {})
+            request_id = params.get("requestId")
+            if method == "Network.requestWillBeSent":
+                request = params["request"]
+                self._requests[request_id] = {
+                    "method": request.get("method"),
+                    "request_headers": request.get("headers", {}),
+                    "post_data": request.get("postData"),
+                    "resource_type": params.get("type"),
+                }
+            elif method == "Network.responseReceived":
+                response = params["response"]
+                self._responses[request_id] = {
+                    "request_id": request_id,
+                    "url": response.get("url"),
+                    "status": response.get("status"),
+                    "mime_type": response.get("mimeType"),
+                    "response_headers": response.get("headers", {}),
+                    "timestamp": params.get("timestamp"),
+                    **self._requests.pop(request_id, {}),
+                }
+            elif method == "Network.loadingFinished" and request_id in self._responses:
+                record = self._responses.pop(request_id)
+                record["encoded_length"] = params.get("encodedDataLength")
+                self.records.append(record)
+                if self.matches(record["url"], record["mime_type"]):
+                    self._fetch_body(driver, record)
+                    self._emit(record)
+                    captured += 1
+            elif method == "Network.loadingFailed":
+                self._requests.pop(request_id, None)
+                self._responses.pop(request_id, None)
+        if captured:
+            logger.info(f"Captured {captured} network responses")
+        return captured
@@ -0,0 +1,151 @@
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, List, Optional
+
+import psutil
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from selenium_base.core.base import DriverManager
+from selenium_base.core.logger import logger
+
+_STOP = object()
+
+
+class DriverPool:
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        memory_per_driver_mb: int = 400,
+        task_retries: int = 1,
+        **driver_kwargs: Any,
+    ) -> None:
+        """
+        Initializes a pool of DriverManager instances fed from a shared task queue.
+
+        Args:
+            size (Optional[int]): Number of browsers to run. Defaults to the CPU count.
+            memory_per_driver_mb (int): Expected memory per browser, used to cap the pool size
+                to what the available memory can hold.
+            task_retries (int): How often a task is retried on a fresh browser after its browser crashed.
+            **driver_kwargs: Arguments passed to every DriverManager. A `network_capture` is
+                copied per driver, since it tracks the requests of one browser; captured responses
+                still reach its callback and sink, and each copy is kept in `network_captures`.
+        """
+        self.size = self._capped_size(size or os.cpu_count() or 1, memory_per_driver_mb)
+        self.task_retries = task_retries
+        self.driver_kwargs = driver_kwargs
+        network_capture = driver_kwargs.get("network_capture")
+        self.network_captures = [network_capture.copy() if network_capture else None for _ in range(self.size)]
+        self.tasks: queue.Queue = queue.Queue()
+        self.drivers: List[Optional[DriverManager]] = [None] * self.size
+        self.workers = [
+            threading.Thread(target=self._worker, args=(index,), name=f"driver-pool-{index}", daemon=True)
+            for index in range(self.size)
+        ]
+        self._closed = False
+        for worker in self.workers:
+            worker.start()
+        logger.info(f"DriverPool started with {self.size} drivers")
+
+    @staticmethod
+    def _capped_size(size: int, memory_per_driver_mb: int) -> int:
+        """Caps the pool size to the number of browsers the available memory can hold."""
+        available_mb = psutil.virtual_memory().available // (1024 * 1024)
+        capped = max(1, min(size, available_mb // memory_per_driver_mb))
+        if capped < size:
+            logger.warning(f"DriverPool size capped from {size} to {capped} ({available_mb} MB available)")
+        return capped
+
+    @staticmethod
+    def is_alive(driver: DriverManager) -> bool:
+        """Returns True if the browser still responds to WebDriver commands."""
+        try:
+            driver.driver.current_url
+            return True
+        except (WebDriverException, MaxRetryError, NewConnectionError):
+            return False
+
+    def _replace(self, index: int) -> DriverManager:
+        """Quits the driver in the slot, if any, and starts a fresh one."""
+        if self.drivers[index] is not None:
+            logger.warning(f"Replacing driver {index}")
+            self.drivers[index].quit_driver()
+        kwargs = dict(self.driver_kwargs)
+        if self.network_captures[index]:
+            kwargs["network_capture"] = self.network_captures[index]
+        self.drivers[index] = DriverManager(**kwargs)
+        return self.drivers[index]
+
+    def _healthy_driver(self, index: int) -> DriverManager:
+        """Returns the driver in the slot, starting or replacing it if it is missing or dead."""
+        driver = self.drivers[index]
+        if driver is None or not self.is_alive(driver):
+            driver = self._replace(index)
+        return driver
+
+    def _worker(self, index: int) -> None:
+        """Runs tasks from the queue on the driver owned by this worker."""
+        while True:
+            item = self.tasks.get()
+            if item is _STOP:
+                self.tasks.task_done()
+                break
+            future, func, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                self.tasks.task_done()
+                continue
+            for attempt in range(self.task_retries + 1):
+                try:
+                    driver = self._healthy_driver(index)
+                    future.set_result(func(driver, *args, **kwargs))
+                    break
+                except Exception as e:
+                    crashed = isinstance(e, (WebDriverException, MaxRetryError, NewConnectionError)) and (
+                        self.drivers[index] is None or not self.is_alive(self.drivers[index])
+                    )
+                    if crashed and attempt < self.task_retries:
+                        logger.warning(f"Driver {index} crashed, retrying task: {e}")
+                        continue
+                    future.set_exception(e)
+                    break
+            self.tasks.task_done()
+        if self.drivers[index] is not None:
+            self.drivers[index].quit_driver()
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Queues a page task. The task is called with a DriverManager as its first argument.
+
+        Returns:
+            Future: Resolves to the return value of the task.
+        """
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+        future: Future = Future()
+        self.tasks.put((future, func, args, kwargs))
+        return future
+
+    def map(self, func: Callable[..., Any], items: Iterable[Any]) -> List[Any]:
+        """Runs the task once per item and returns the results in order, raising the first error."""
+        futures = [self.submit(func, item) for item in items]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Waits for the queued tasks, then stops the workers and quits their browsers."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self.workers:
+            self.tasks.put(_STOP)
+        for worker in self.workers:
+            worker.join()
+        logger.info("DriverPool closed")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,108 @@
+"""JavaScript snippets evaluated in the page by DriverManager."""
+
+# Counts in-flight fetch/XHR requests in window.__pendingRequests. Installed once per document.
+INSTALL_REQUEST_TRACKER = """
+if (window.__pendingRequests === undefined) {
+    window.__pendingRequests = 0;
+    const track = () => { window.__pendingRequests++; };
+    const untrack = () => { window.__pendingRequests = Math.max(0, window.__pendingRequests - 1); };
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function () {
+            track();
+            return originalFetch.apply(this, arguments).finally(untrack);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        track();
+        this.addEventListener('loadend', untrack, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+}
+"""
+
+# Resolves once nothing changed for `quiet` ms: no DOM mutation and, if `network` is set, no
+# pending fetch/XHR. Resolves early with `grown: true` when `growth` is set and the page grew,
+# after optionally scrolling to the bottom first.
+# Arguments: quiet (ms), timeout (ms), network (bool), growth (bool), scroll (bool), callback.
+WAIT_FOR_QUIET = """
+const [quiet, timeout, network, growth, scroll, done] = arguments;
+const start = performance.now();
+const startHeight = document.body.scrollHeight;
+let lastChange = start;
+const observer = new MutationObserver(() => { lastChange = performance.now(); });
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+if (scroll) {
+    window.scrollTo(0, document.body.scrollHeight);
+}
+const finish = (result) => {
+    observer.disconnect();
+    done(Object.assign({height: document.body.scrollHeight, elapsed: performance.now() - start}, result));
+};
+(function check() {
+    const now = performance.now();
+    if (network && (window.__pendingRequests || 0) > 0) {
+        lastChange = now;
+    }
+    if (growth && document.body.scrollHeight > startHeight) {
+        return finish({grown: true, timedOut: false});
+    }
+    if (now - lastChange >= quiet) {
+        return finish({grown: false, timedOut: false});
+    }
+    if (now - start >= timeout) {
+        return finish({grown: false, timedOut: true});
+    }
+    setTimeout(check, 50);
+})();
+"""
+
+# Evaluates a normalized extraction spec against the document and returns plain JSON.
+# Every field is {selector, attr, many, fields}; selectors starting with "xpath:", "/", "./"
+# or "(" are XPath, everything else CSS. Nested `fields` are evaluated relative to each match.
+# Arguments: spec.
+EXTRACT = """
+const [spec] = arguments;
+const isXPath = (selector) => /^(xpath:|\\/|\\.\\/|\\()/.test(selector);
+const query = (context, selector, many) => {
+    if (isXPath(selector)) {
+        const expression = selector.startsWith('xpath:') ? selector.slice(6) : selector;
+        const result = document.evaluate(expression, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < result.snapshotLength; i++) {
+            nodes.push(result.snapshotItem(i));
+        }
+        return many ? nodes : (nodes[0] || null);
+    }
+    return many ? Array.from(context.querySelectorAll(selector)) : context.querySelector(selector);
+};
+const read = (node, attr) => {
+    if (!node) {
+        return null;
+    }
+    switch (attr) {
+        case 'text':
+            return (node.innerText !== undefined ? node.innerText : node.textContent).trim();
+        case 'html':
+            return node.innerHTML;
+        case 'outer_html':
+            return node.outerHTML;
+        case 'href':
+        case 'src':
+            return node[attr] || node.getAttribute(attr);
+        default:
+            return node.getAttribute(attr);
+    }
+};
+const extract = (context, fields) => {
+    const data = {};
+    for (const [name, field] of Object.entries(fields)) {
+        const found = field.selector ? query(context, field.selector, field.many) : (field.many ? [context] : context);
+        const convert = field.fields ? (node) => (node ? extract(node, field.fields) : null) : (node) => read(node, field.attr);
+        data[name] = field.many ? found.map(convert) : convert(found);
+    }
+    return data;
+};
+return extract(document, spec);
+"""
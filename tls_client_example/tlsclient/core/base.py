@@ -2,19 +2,68 @@ import tls_client
 import json
 import logging
 import asyncio
+import time
 from typing import Dict, Any, Optional, List, Tuple, Literal
 
+from urllib.parse import urlparse
+
+from tlsclient.core.cookie_store import CookieStore
+from tlsclient.core.fingerprint import FingerprintPool
 from tlsclient.core.logger import logger
 
 class TLSClientManager:
-    def __init__(self, client_identifier: str, async_mode: bool = False):
+    def __init__(self, client_identifier: str, async_mode: bool = False, cookie_store: Optional[CookieStore] = None):
         """
         Initializes the TLSClientManager with optional client identifier and async mode.
+        When a cookie store is given, its cookies are loaded into the session.
         """
         self.session = tls_client.Session(client_identifier=client_identifier)
         self.async_mode = async_mode
+        self.cookie_store = cookie_store
+        if self.cookie_store:
+            self.load_cookies()
         logger.info("TLSClientManager initialized. Async mode: %s", self.async_mode)
 
+    def set_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """
+        Adds cookies in the Selenium dict format (name, value, domain, path, expiry, secure, httpOnly) to the TLS session.
+        """
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain") or "",
+                path=cookie.get("path") or "/",
+                expires=cookie.get("expiry"),
+                secure=cookie.get("secure", False),
+                rest={"HttpOnly": None} if cookie.get("httpOnly") else {},
+            )
+        logger.info("Cookies set: %d", len(cookies))
+
+    def load_cookies(self) -> None:
+        """
+        Loads the unexpired cookies of the cookie store into the TLS session.
+        """
+        self.set_cookies(self.cookie_store.all())
+
+    def save_cookies(self) -> None:
+        """
+        Writes the TLS session cookies back to the cookie store.
+        """
+        self.cookie_store.update(
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expiry": cookie.expires,
+                "secure": cookie.secure,
+                "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+            }
+            for cookie in self.session.cookies
+        )
+        self.cookie_store.save()
+
     def set_headers(self, headers: Dict[str, str]) -> None:
         """
         Sets headers for the TLS session.
@@ -58,36 +107,112 @@ class TLSClientManager:
             logger.error("Error sending request: %s", e)
             raise
 
+    def get_json_response(self, response: tls_client.response.Response) -> Dict[str, Any]:
+        """
+        Returns the JSON body of a response, or the raw text under "text" when the body is not JSON.
+        """
+        try:
+            return response.json()
+        except ValueError as e:
+            logger.warning("Response from %s is not JSON: %s", response.url, e)
+            return {"text": response.text}
 
     def close(self) -> None:
         """
-        Closes the TLS session.
+        Closes the TLS session, saving its cookies first when a cookie store is set.
         """
+        if self.cookie_store:
+            self.save_cookies()
         self.session.close()
         logger.info("TLS session closed.")
 
 class HTTPClient:
-    def __init__(self, client_identifier: str = "chrome_108", async_mode: bool = False):
-        self.client_manager = TLSClientManager(client_identifier, async_mode)
+    def __init__(
+        self,
+        client_identifier: str = "chrome_108",
+        async_mode: bool = False,
+        fingerprint_pool: Optional[FingerprintPool] = None,
+        cookie_store: Optional[CookieStore] = None,
+    ):
+        """
+        Initializes the HTTPClient.
+
+        When a fingerprint pool is given, the identifier is chosen per request from the pool
+        and the outcome of each request is fed back into its per-domain statistics.
+        When a cookie store is given, every session loads it on creation and writes back on close.
+        """
+        self.async_mode = async_mode
+        self.fingerprint_pool = fingerprint_pool
+        self.cookie_store = cookie_store
+        self.client_manager = TLSClientManager(client_identifier, async_mode, cookie_store)
+        self.client_managers: Dict[str, TLSClientManager] = {client_identifier: self.client_manager}
+        self.headers: Dict[str, str] = {}
+        self.proxies: Dict[str, str] = {}
+        self.cookies: List[Dict[str, Any]] = []
+
+    def _get_client_manager(self, identifier: str) -> TLSClientManager:
+        """Returns the manager for an identifier, creating it with the current headers, proxies and cookies."""
+        if identifier not in self.client_managers:
+            client_manager = TLSClientManager(identifier, self.async_mode, self.cookie_store)
+            if self.headers:
+                client_manager.set_headers(self.headers)
+            if self.proxies:
+                client_manager.set_proxies(self.proxies)
+            if self.cookies:
+                client_manager.set_cookies(self.cookies)
+            self.client_managers[identifier] = client_manager
+        return self.client_managers[identifier]
+
+    def _record(self, domain: str, identifier: str, response: tls_client.response.Response, elapsed: float) -> None:
+        """Feeds the outcome of a request back into the fingerprint pool."""
+        if self.fingerprint_pool.is_block(response.status_code):
+            self.fingerprint_pool.record_block(domain, identifier)
+        else:
+            self.fingerprint_pool.record_success(domain, identifier, elapsed)
 
     def set_headers(self, headers: Dict[str, str]) -> None:
-        self.client_manager.set_headers(headers)
+        self.headers.update(headers)
+        for client_manager in self.client_managers.values():
+            client_manager.set_headers(headers)
+
+    def set_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        self.cookies = list(cookies)
+        for client_manager in self.client_managers.values():
+            client_manager.set_cookies(cookies)
 
     def set_proxies(self, proxies: Dict[str, str]) -> None:
-        self.client_manager.set_proxies(proxies)
+        self.proxies = proxies
+        for client_manager in self.client_managers.values():
+            client_manager.set_proxies(proxies)
 
     async def async_request(self, method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
-        response = await self.client_manager.async_request(method, url, **kwargs)
+        if not self.fingerprint_pool:
+            return await self.client_manager.async_request(method, url, **kwargs)
+        domain = urlparse(url).netloc
+        identifier = self.fingerprint_pool.choose(domain)
+        start = time.perf_counter()
+        response = await self._get_client_manager(identifier).async_request(method, url, **kwargs)
+        self._record(domain, identifier, response, time.perf_counter() - start)
         return response
 
     def sync_request(self, method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
-        response = self.client_manager.sync_request(method, url, **kwargs)
-        return self.client_manager.get_json_response(response)
+        if not self.fingerprint_pool:
+            response = self.client_manager.sync_request(method, url, **kwargs)
+            return self.client_manager.get_json_response(response)
+        domain = urlparse(url).netloc
+        identifier = self.fingerprint_pool.choose(domain)
+        client_manager = self._get_client_manager(identifier)
+        start = time.perf_counter()
+        response = client_manager.sync_request(method, url, **kwargs)
+        self._record(domain, identifier, response, time.perf_counter() - start)
+        return client_manager.get_json_response(response)
 
     async def async_multi_request(self, urls: List[str], method: Literal["GET", "POST"] = "GET") -> List[Dict[str, Any]]:
         tasks = [self.async_request(method, url) for url in urls]
         return await asyncio.gather(*tasks)
     
     def close(self) -> None:
-        self.client_manager.close()
-
+        for client_manager in self.client_managers.values():
+            client_manager.close()
+        if self.fingerprint_pool:
+            self.fingerprint_pool.save()
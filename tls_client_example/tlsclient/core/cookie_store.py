@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from tlsclient.core.logger import logger
+
+
+class CookieStore:
+    def __init__(self, path: Path | str, session_ttl: float = 3600.0) -> None:
+        """
+        Initializes a domain-keyed cookie store backed by a JSON file.
+
+        The file format is shared with selenium_base so that clearances obtained in a
+        browser can be reused by the HTTP clients and the other way round.
+
+        Args:
+            path (Path | str): JSON file the cookies are persisted to.
+            session_ttl (float): Seconds a cookie without an expiry is kept after it was stored.
+        """
+        self.path = Path(path)
+        self.session_ttl = session_ttl
+        self.cookies: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    @staticmethod
+    def _key(cookie: Dict[str, Any]) -> str:
+        """Returns the key identifying a cookie within its domain."""
+        return f"{cookie['name']}|{cookie.get('path') or '/'}"
+
+    def _is_expired(self, cookie: Dict[str, Any], now: float) -> bool:
+        """Returns True if the cookie has expired or is a stale session cookie."""
+        if cookie.get("expiry"):
+            return cookie["expiry"] <= now
+        return cookie.get("stored_at", now) + self.session_ttl <= now
+
+    def _merge(self, cookies: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+        """Merges cookies into the store, keeping the most recently stored version of each."""
+        for domain, entries in cookies.items():
+            current = self.cookies.setdefault(domain, {})
+            for key, cookie in entries.items():
+                if key not in current or cookie.get("stored_at", 0) >= current[key].get("stored_at", 0):
+                    current[key] = cookie
+
+    def purge_expired(self) -> None:
+        """Removes expired cookies and empty domains."""
+        now = time.time()
+        with self._lock:
+            for domain in list(self.cookies):
+                entries = self.cookies[domain]
+                for key in [k for k, cookie in entries.items() if self._is_expired(cookie, now)]:
+                    del entries[key]
+                if not entries:
+                    del self.cookies[domain]
+
+    def update(self, cookies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Adds or replaces cookies in the store.
+
+        Cookies use the Selenium dict format: name, value, domain, path, expiry, secure and httpOnly.
+        """
+        now = time.time()
+        with self._lock:
+            for cookie in cookies:
+                domain = (cookie.get("domain") or "").lstrip(".")
+                if not domain:
+                    continue
+                entry = {
+                    "name": cookie["name"],
+                    "value": cookie["value"],
+                    "domain": cookie.get("domain"),
+                    "path": cookie.get("path") or "/",
+                    "expiry": int(cookie["expiry"]) if cookie.get("expiry") else None,
+                    "secure": bool(cookie.get("secure", False)),
+                    "httpOnly": bool(cookie.get("httpOnly", False)),
+                    "stored_at": now,
+                }
+                self.cookies.setdefault(domain, {})[self._key(entry)] = entry
+
+    def get(self, domain: str) -> List[Dict[str, Any]]:
+        """Returns the unexpired cookies that apply to the domain, including parent domains."""
+        now = time.time()
+        domain = domain.split(":")[0].lstrip(".")
+        parts = domain.split(".")
+        # The host itself and its parents, leaving out the top-level domain unless the host is
+        # a single label such as localhost
+        candidates = {".".join(parts[i:]) for i in range(max(len(parts) - 1, 1))}
+        with self._lock:
+            return [
+                dict(cookie)
+                for candidate in candidates
+                for cookie in self.cookies.get(candidate, {}).values()
+                if not self._is_expired(cookie, now)
+            ]
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Returns every unexpired cookie in the store."""
+        now = time.time()
+        with self._lock:
+            return [
+                dict(cookie)
+                for entries in self.cookies.values()
+                for cookie in entries.values()
+                if not self._is_expired(cookie, now)
+            ]
+
+    def load(self) -> None:
+        """Loads the cookies from disk, merging them into the store."""
+        if not self.path.exists():
+            return
+        try:
+            cookies = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error("Error loading cookie store: %s", e)
+            return
+        with self._lock:
+            self._merge(cookies)
+        self.purge_expired()
+        logger.info("Loaded cookies for %d domains from %s", len(self.cookies), self.path)
+
+    def save(self) -> None:
+        """
+        Writes the cookies to disk.
+
+        The file is re-read first so that cookies written by other sessions or runs in the
+        meantime are merged instead of overwritten.
+        """
+        self.load()
+        with self._lock:
+            content = json.dumps(self.cookies, indent=2)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(content)
+            tmp_path.replace(self.path)
+            logger.info("Saved cookies for %d domains to %s", len(self.cookies), self.path)
+        except OSError as e:
+            logger.error("Error saving cookie store: %s", e)
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from tlsclient.core.base import HTTPClient
+from tlsclient.core.logger import logger
+
+TIERS = ("aiohttp", "tls_client", "selenium")
+BLOCK_STATUS_CODES = frozenset({401, 403, 407, 429, 503})
+# Markers of full-page interstitials only: widgets such as reCAPTCHA also appear on normal pages
+CHALLENGE_MARKERS = (
+    "cf-chl",
+    "Just a moment...",
+    "_Incapsula_Resource",
+)
+CHALLENGE_MAX_LENGTH = 50000
+
+
+@dataclass
+class FetchResult:
+    url: str
+    tier: str
+    status_code: int
+    text: str
+    elapsed: float
+
+
+class TransportEscalator:
+    def __init__(
+        self,
+        aiohttp_client: Any = None,
+        http_client: Optional[HTTPClient] = None,
+        driver: Any = None,
+        state_path: Optional[Path | str] = None,
+        block_status_codes: Iterable[int] = BLOCK_STATUS_CODES,
+        challenge_markers: Iterable[str] = CHALLENGE_MARKERS,
+        min_body_length: int = 1,
+        challenge_max_length: int = CHALLENGE_MAX_LENGTH,
+        memory_ttl: float = 86400.0,
+    ) -> None:
+        """
+        Initializes a fetch facade that tries the cheapest transport first and escalates on blocks.
+
+        The transports are duck-typed so that the projects stay independent: `aiohttp_client` is an
+        `AioHttpClientManager`, `http_client` an `HTTPClient` and `driver` a selenium_base
+        `DriverManager`. Tiers that are not given are skipped.
+
+        Args:
+            state_path (Optional[Path | str]): JSON file the per-domain tier memory is persisted to.
+            block_status_codes (Iterable[int]): Status codes that count as a block.
+            challenge_markers (Iterable[str]): Body substrings that identify a challenge page.
+            min_body_length (int): Bodies shorter than this, after stripping, count as a block.
+            challenge_max_length (int): Bodies longer than this are real pages and are not checked
+                for challenge markers.
+            memory_ttl (float): Seconds after which a remembered tier is forgotten and cheaper tiers are retried.
+        """
+        self.transports = {"aiohttp": aiohttp_client, "tls_client": http_client, "selenium": driver}
+        self.tiers = [tier for tier in TIERS if self.transports[tier] is not None]
+        if not self.tiers:
+            raise ValueError("TransportEscalator needs at least one transport")
+        self.state_path = Path(state_path) if state_path else None
+        self.block_status_codes = frozenset(block_status_codes)
+        self.challenge_markers = tuple(challenge_markers)
+        self.min_body_length = min_body_length
+        self.challenge_max_length = challenge_max_length
+        self.memory_ttl = memory_ttl
+        self.domain_tiers: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._driver_lock = asyncio.Lock()
+        self.load()
+        logger.info("TransportEscalator initialized with tiers: %s", self.tiers)
+
+    def is_blocked(self, status_code: int, text: Optional[str], check_markers: bool = True) -> bool:
+        """
+        Returns True if the response looks like a block, a challenge page or an empty body.
+
+        Challenge markers are only searched in short bodies, since interstitials are small pages
+        while a real page may embed the same scripts, e.g. a login form with a captcha widget.
+        """
+        if status_code in self.block_status_codes:
+            return True
+        if text is None or len(text.strip()) < self.min_body_length:
+            return True
+        if not check_markers or len(text) > self.challenge_max_length:
+            return False
+        return any(marker in text for marker in self.challenge_markers)
+
+    def tier_for(self, domain: str) -> str:
+        """Returns the tier to start with for the domain."""
+        with self._lock:
+            entry = self.domain_tiers.get(domain)
+        if entry and entry["tier"] in self.tiers and time.time() - entry["updated_at"] < self.memory_ttl:
+            return entry["tier"]
+        return self.tiers[0]
+
+    def remember(self, domain: str, tier: str) -> None:
+        """Remembers the tier that worked for the domain."""
+        with self._lock:
+            previous = self.domain_tiers.get(domain, {}).get("tier")
+            self.domain_tiers[domain] = {"tier": tier, "updated_at": time.time()}
+        if previous != tier:
+            logger.info("Remembering tier %s for %s", tier, domain)
+
+    async def _fetch_with(self, tier: str, url: str, method: str, **kwargs: Any) -> FetchResult:
+        """Fetches the URL with a single tier."""
+        start = time.perf_counter()
+        if tier == "aiohttp":
+            status_code, text = await self.transports[tier].fetch(url, method, **kwargs)
+        elif tier == "tls_client":
+            response = await self.transports[tier].async_request(method, url, **kwargs)
+            status_code, text = response.status_code, response.text
+        else:
+            if method.upper() != "GET":
+                raise ValueError("The selenium tier only supports GET requests")
+            async with self._driver_lock:
+                text = await asyncio.get_running_loop().run_in_executor(None, self._browser_fetch, url)
+            status_code = 200
+        return FetchResult(url, tier, status_code, text, time.perf_counter() - start)
+
+    def _browser_fetch(self, url: str) -> str:
+        """Loads the URL in the browser and returns the rendered page source."""
+        driver = self.transports["selenium"]
+        driver.get(url)
+        return driver.driver.page_source
+
+    async def fetch(self, url: str, method: str = "GET", **kwargs: Any) -> FetchResult:
+        """
+        Fetches the URL, starting at the tier remembered for its domain and escalating on blocks.
+
+        Raises:
+            RuntimeError: If every tier was blocked or failed. The last result is not returned,
+                since a challenge page is never what the caller wants.
+        """
+        domain = urlparse(url).netloc
+        start_tier = self.tier_for(domain)
+        last_error: Optional[BaseException] = None
+        for tier in self.tiers[self.tiers.index(start_tier):]:
+            try:
+                result = await self._fetch_with(tier, url, method, **kwargs)
+            except Exception as e:
+                logger.warning("Tier %s failed for %s: %s", tier, url, e)
+                last_error = e
+                continue
+            # The last tier has nothing to escalate to, so only hard blocks count there
+            if self.is_blocked(result.status_code, result.text, check_markers=tier != self.tiers[-1]):
+                logger.warning("Tier %s blocked on %s with status code: %d", tier, url, result.status_code)
+                continue
+            self.remember(domain, tier)
+            return result
+        raise RuntimeError(f"All transports blocked or failed for {url}") from last_error
+
+    async def multi_fetch(self, urls: List[str], method: str = "GET", **kwargs: Any) -> List[FetchResult | BaseException]:
+        """Fetches several URLs concurrently, returning exceptions in place of failed results."""
+        tasks = [self.fetch(url, method, **kwargs) for url in urls]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def load(self) -> None:
+        """Loads the per-domain tier memory from the state file if it exists."""
+        if not self.state_path or not self.state_path.exists():
+            return
+        try:
+            self.domain_tiers = json.loads(self.state_path.read_text())
+            logger.info("Loaded transport tiers for %d domains from %s", len(self.domain_tiers), self.state_path)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error("Error loading transport tiers: %s", e)
+
+    def save(self) -> None:
+        """Persists the per-domain tier memory to the state file."""
+        if not self.state_path:
+            return
+        with self._lock:
+            content = json.dumps(self.domain_tiers, indent=2)
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_path.with_suffix(".tmp")
+            tmp_path.write_text(content)
+            tmp_path.replace(self.state_path)
+        except OSError as e:
+            logger.error("Error saving transport tiers: %s", e)
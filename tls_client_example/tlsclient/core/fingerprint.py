@@ -0,0 +1,128 @@
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from tlsclient.core.logger import logger
+
+DEFAULT_IDENTIFIERS = (
+    "chrome_120",
+    "chrome_117",
+    "chrome_112",
+    "chrome_108",
+    "firefox_120",
+    "safari_16_0",
+)
+BLOCK_STATUS_CODES = frozenset({401, 403, 407, 429, 503})
+
+
+class FingerprintPool:
+    def __init__(
+        self,
+        identifiers: Iterable[str] = DEFAULT_IDENTIFIERS,
+        state_path: Optional[Path | str] = None,
+        block_cooldown: float = 900.0,
+        latency_alpha: float = 0.3,
+    ) -> None:
+        """
+        Initializes a pool of tls_client identifiers with per-domain statistics.
+
+        Args:
+            identifiers (Iterable[str]): The tls_client identifiers to rotate between.
+            state_path (Optional[Path | str]): JSON file used to persist learned statistics between runs.
+            block_cooldown (float): Seconds an identifier is skipped for a domain after being blocked.
+            latency_alpha (float): Smoothing factor of the per-identifier latency moving average.
+        """
+        self.identifiers: List[str] = list(identifiers)
+        if not self.identifiers:
+            raise ValueError("FingerprintPool needs at least one client identifier")
+        self.state_path = Path(state_path) if state_path else None
+        self.block_cooldown = block_cooldown
+        self.latency_alpha = latency_alpha
+        self.stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+        self.load()
+        logger.info("FingerprintPool initialized with identifiers: %s", self.identifiers)
+
+    def _entry(self, domain: str, identifier: str) -> Dict[str, float]:
+        """Returns the mutable statistics entry for an identifier on a domain."""
+        return self.stats.setdefault(domain, {}).setdefault(
+            identifier, {"successes": 0, "blocks": 0, "latency": 0.0, "blocked_until": 0.0}
+        )
+
+    def _weight(self, entry: Dict[str, float]) -> float:
+        """Scores an identifier by its smoothed success rate divided by its average latency."""
+        success_rate = (entry["successes"] + 1) / (entry["successes"] + entry["blocks"] + 2)
+        latency = entry["latency"] or 1.0
+        return success_rate / latency
+
+    def choose(self, domain: str) -> str:
+        """
+        Picks an identifier for the domain.
+
+        Identifiers that are cooling down after a block are skipped, the rest are drawn
+        with a probability proportional to their weight so faster, rarely blocked
+        profiles are preferred while the others keep being sampled.
+        """
+        now = time.time()
+        with self._lock:
+            entries = {identifier: self._entry(domain, identifier) for identifier in self.identifiers}
+            available = [i for i, entry in entries.items() if entry["blocked_until"] <= now]
+            if not available:
+                identifier = min(entries, key=lambda i: entries[i]["blocked_until"])
+                logger.warning("All identifiers blocked for %s, falling back to %s", domain, identifier)
+                return identifier
+            weights = [self._weight(entries[i]) for i in available]
+        identifier = random.choices(available, weights=weights)[0]
+        logger.debug("Chose identifier %s for %s", identifier, domain)
+        return identifier
+
+    def record_success(self, domain: str, identifier: str, elapsed: float) -> None:
+        """Records a successful response and updates the latency moving average."""
+        with self._lock:
+            entry = self._entry(domain, identifier)
+            entry["successes"] += 1
+            if entry["latency"]:
+                entry["latency"] += self.latency_alpha * (elapsed - entry["latency"])
+            else:
+                entry["latency"] = elapsed
+            entry["blocked_until"] = 0.0
+
+    def record_block(self, domain: str, identifier: str) -> None:
+        """Records a block and puts the identifier on cooldown for the domain."""
+        with self._lock:
+            entry = self._entry(domain, identifier)
+            entry["blocks"] += 1
+            entry["blocked_until"] = time.time() + self.block_cooldown
+        logger.warning("Identifier %s blocked on %s", identifier, domain)
+
+    def is_block(self, status_code: int) -> bool:
+        """Returns True if the status code signals a fingerprint block."""
+        return status_code in BLOCK_STATUS_CODES
+
+    def load(self) -> None:
+        """Loads persisted statistics from the state file if it exists."""
+        if not self.state_path or not self.state_path.exists():
+            return
+        try:
+            self.stats = json.loads(self.state_path.read_text())
+            logger.info("Loaded fingerprint statistics from %s", self.state_path)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error("Error loading fingerprint statistics: %s", e)
+
+    def save(self) -> None:
+        """Persists the statistics to the state file."""
+        if not self.state_path:
+            return
+        with self._lock:
+            content = json.dumps(self.stats, indent=2)
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_path.with_suffix(".tmp")
+            tmp_path.write_text(content)
+            tmp_path.replace(self.state_path)
+            logger.info("Saved fingerprint statistics to %s", self.state_path)
+        except OSError as e:
+            logger.error("Error saving fingerprint statistics: %s", e)